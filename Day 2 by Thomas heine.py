@@ -30,6 +30,9 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 import math
 from decimal import Decimal, ROUND_DOWN
 
+# two decimal place template used when rounding results for display
+TWO_PLACES = Decimal('0.00')
+
 
 def menuHint():
     print("(type 'menu' to return)")
@@ -125,9 +128,9 @@ while True:
             because this otherwise makes realy wierd numbers
             """
             
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            resHz = Decimal(resHz).quantize(TWO_PLACES, rounding=ROUND_DOWN)
+            qFac = Decimal(qFac).quantize(TWO_PLACES, rounding=ROUND_DOWN)
+            bandHz = Decimal(bandHz).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"Comp vals: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
@@ -148,7 +151,7 @@ while True:
                 break
 
             total = resSeries(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = Decimal(total).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"Series resistance: {total} Ω\n")
@@ -163,7 +166,7 @@ while True:
                 break
 
             total = resParallel(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = Decimal(total).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"Parallel resistance: {total} Ω\n")
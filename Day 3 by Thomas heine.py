@@ -28,47 +28,61 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 """
 
 import math
-from decimal import Decimal, ROUND_DOWN
+from math import sqrt
 
 
 def menuHint():
     print("(type 'menu' to return or 'quit' to exit)")
 
 
+# words that leave a prompt instead of entering a value
+EXIT_TOKENS = frozenset(("menu", "quit"))
+
+
 def getComp(unitNam):
     """prompt user for a component value and ensure it is greater than zero."""
-    menuHint()
-    val = input(f"What is the {unitNam}? ")
-    if val.strip().lower() in ["menu", "quit"]:
-        return val.strip().lower()
-    val = float(val)
-    while val <= 0.0:
+    question = f"What is the {unitNam}? "
+    prompt = question
+    while True:
         menuHint()
-        val = input(f"The value must be greater than zero\n"
-                    f"What is the {unitNam}? ")
-        if val.strip().lower() in ["menu", "quit"]:
-            return val.strip().lower()
-        val = float(val)
-    return val
+        text = input(prompt).strip().lower()
+        if text in EXIT_TOKENS:
+            return text
+        try:
+            val = float(text)
+        except ValueError:
+            prompt = "The value must be a number\n" + question
+            continue
+        if val > 0.0:
+            return val
+        prompt = "The value must be greater than zero\n" + question
 
 
 """--- calculating methods ---"""
 
+TWO_PI = 2.0 * math.pi
+
+
 def resFrq(indH, capF):
-    return 1 / (2 * math.pi * math.sqrt(indH * capF))
+    return 1.0 / (TWO_PI * sqrt(indH * capF))
 
 
 def qFact(indH, resOhm, capF):
-    return (1 / resOhm) * math.sqrt(indH / capF)
+    return sqrt(indH / capF) / resOhm
 
 
 def band(resHz, qFac):
     return resHz / qFac
 
 
+# multipliers for the metric prefixes, keyed by power of 10
+SI_PREFIX = {-12: 1e-12, -9: 1e-9, -6: 1e-6, -3: 1e-3,
+             0: 1.0, 3: 1e3, 6: 1e6, 9: 1e9}
+
+
 def cnvUnt(val, expn):
-    """convert metric-prefixed units to base units using powers of 10."""
-    return val * 10 ** expn
+    """convert metric-prefixed units to base units using the prefix table."""
+    return val * SI_PREFIX[expn]
 
 
 def resSeries(r1, r2):
@@ -85,6 +99,11 @@ def rcTimeConst(r, c):
     """calculate RC time constant tau = R * C."""
     return r * c
 
+
+def trunc2(val):
+    """truncate a result to two decimal places for display."""
+    return math.floor(val * 100) / 100
+
 """-------"""
 
 
@@ -135,18 +154,15 @@ while True:
             """ round results to two decimal places
             because this otherwise makes realy wierd numbers
             """
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            resHz = trunc2(resHz)
+            qFac = trunc2(qFac)
+            bandHz = trunc2(bandHz)
 
             menuHint()
-            print(f"Comp vals: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
-            menuHint()
-            print(f"Resonant freq: {resHz} Hz\n")
-            menuHint()
-            print(f"Q factor: {qFac}\n")
-            menuHint()
-            print(f"Bandwidth: {bandHz} Hz\n")
+            print(f"Comp vals: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n\n"
+                  f"Resonant freq: {resHz:.2f} Hz\n\n"
+                  f"Q factor: {qFac:.2f}\n\n"
+                  f"Bandwidth: {bandHz:.2f} Hz\n")
 
     elif choice == "2":
         while True:
@@ -160,10 +176,10 @@ while True:
                 break
 
             total = resSeries(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = trunc2(total)
 
             menuHint()
-            print(f"Series resistance: {total} Ω\n")
+            print(f"Series resistance: {total:.2f} Ω\n")
 
     elif choice == "3":
         while True:
@@ -177,10 +193,10 @@ while True:
                 break
 
             total = resParallel(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = trunc2(total)
 
             menuHint()
-            print(f"Parallel resistance: {total} Ω\n")
+            print(f"Parallel resistance: {total:.2f} Ω\n")
 
     elif choice == "4":
         while True:
@@ -195,10 +211,10 @@ while True:
 
             cF = cnvUnt(cUf, -6)  # convert µF to F
             tau = rcTimeConst(r, cF)
-            tau = Decimal(tau).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            tau = trunc2(tau)
 
             menuHint()
-            print(f"RC time constant: {tau} seconds\n")
+            print(f"RC time constant: {tau:.2f} seconds\n")
 
     else:
         menuHint()
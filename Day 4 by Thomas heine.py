@@ -30,6 +30,9 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 import math
 from decimal import Decimal, ROUND_DOWN
 
+# two decimal place template used when rounding results for display
+TWO_PLACES = Decimal('0.00')
+
 """ "quit" changed to "q" on day 4"""
 
 def menuHint():
@@ -133,9 +136,9 @@ while True:
             qFac = qFact(indH, resOhm, capF)
             bandHz = band(resHz, qFac)
 
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            resHz = Decimal(resHz).quantize(TWO_PLACES, rounding=ROUND_DOWN)
+            qFac = Decimal(qFac).quantize(TWO_PLACES, rounding=ROUND_DOWN)
+            bandHz = Decimal(bandHz).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"LCR component values: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
@@ -158,7 +161,7 @@ while True:
                 break
 
             total = resSeries(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = Decimal(total).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"series resistance: {total} Ω\n")
@@ -175,7 +178,7 @@ while True:
                 break
 
             total = resParallel(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            total = Decimal(total).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"parallel resistance: {total} Ω\n")
@@ -193,7 +196,7 @@ while True:
 
             cF = cnvUnt(cUf, -6)
             tau = rcTimeConst(r, cF)
-            tau = Decimal(tau).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            tau = Decimal(tau).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"RC time constant: {tau} seconds\n")
@@ -212,7 +215,7 @@ while True:
             indH = cnvUnt(indMh, -3)
             capF = cnvUnt(capUf, -6)
             resHz = resFrq(indH, capF)
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+            resHz = Decimal(resHz).quantize(TWO_PLACES, rounding=ROUND_DOWN)
 
             menuHint()
             print(f"the resonant frequency: {resHz} Hz\n")
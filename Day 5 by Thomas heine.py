@@ -28,74 +28,233 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 """
 
 import math
-from decimal import Decimal, ROUND_DOWN
+import sys
+from math import sqrt
+
+# numba is optional, the calculator runs as plain python without it
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# numba signatures, giving one makes numba compile when the module loads
+TWO_FLOATS = "float64(float64, float64)"
+
+
+def jit(signature):
+    """compile a calculating method with numba when it is installed."""
+    def wrap(func):
+        if HAVE_NUMBA:
+            return njit(signature, cache=True, fastmath=True)(func)
+        return func
+    return wrap
+
 
 """ "quit" changed to "q" on day 4"""
 
+MENU_HINT = "(type 'menu' to return or 'q' to quit)\n"
+
+
 def menuHint():
-    print("(type 'menu' to return or 'q' to quit)")   
+    sys.stdout.write(MENU_HINT)
+
+
+class MenuReturn(Exception):
+    """raised by getComp when the user types 'menu'."""
+
+
+class QuitRequested(Exception):
+    """raised by getComp when the user types 'q'."""
+
+
+# words that leave a prompt instead of entering a value
+EXIT_TOKENS = {"menu": MenuReturn, "q": QuitRequested}
 
 
 def getComp(unitNam):
-    """prompt user for a component value and ensure it is greater than zero."""
-    menuHint()
-    val = input(f"what is the {unitNam}? ")
-    if val.strip().lower() in ["menu", "q"]:
-        return val.strip().lower()
-    val = float(val)
-    while val <= 0.0:
+    """prompt user for a component value and ensure it is greater than zero.
+
+    raises MenuReturn or QuitRequested if the user types one of the EXIT_TOKENS.
+    """
+    question = f"what is the {unitNam}? "
+    prompt = question
+    while True:
         menuHint()
-        val = input(f"the value must be greater than zero\n"
-                    f"what is the {unitNam}? ")
-        if val.strip().lower() in ["menu", "q"]:
-            return val.strip().lower()
-        val = float(val)
-    return val
+        text = input(prompt).strip().lower()
+        if text in EXIT_TOKENS:
+            raise EXIT_TOKENS[text]()
+        try:
+            val = float(text)
+        except ValueError:
+            prompt = "the value must be a number\n" + question
+            continue
+        if val > 0.0:
+            return val
+        prompt = "the value must be greater than zero\n" + question
 
 
 """--- calculating methods ---"""
 
+TWO_PI = 2.0 * math.pi
+
+
+@jit(TWO_FLOATS)
 def resFrq(indH, capF):
-    return 1 / (2 * math.pi * math.sqrt(indH * capF))
+    return 1.0 / (TWO_PI * sqrt(indH * capF))
+
 
+@jit("UniTuple(float64, 3)(float64, float64, float64)")
+def rlc(indH, capF, resOhm):
+    """resonant frequency, Q factor and bandwidth of a series RLC in one pass.
 
-def qFact(indH, resOhm, capF):
-    return (1 / resOhm) * math.sqrt(indH / capF)
+    bandwidth = f / Q simplifies to R / (2 pi L) so it needs no square root.
+    """
+    resHz = 1.0 / (TWO_PI * sqrt(indH * capF))
+    qFac = sqrt(indH / capF) / resOhm
+    bandHz = resOhm / (TWO_PI * indH)
+    return resHz, qFac, bandHz
 
 
-def band(resHz, qFac):
-    return resHz / qFac
+# multipliers for the metric prefixes, keyed by power of 10
+SI_PREFIX = {-12: 1e-12, -9: 1e-9, -6: 1e-6, -3: 1e-3,
+             0: 1.0, 3: 1e3, 6: 1e6, 9: 1e9}
 
 
 def cnvUnt(val, expn):
-    """convert metric-prefixed units to base units using powers of 10."""
-    return val * 10 ** expn
+    """convert metric-prefixed units to base units using the prefix table."""
+    return val * SI_PREFIX[expn]
 
 
+@jit(TWO_FLOATS)
 def resSeries(r1, r2):
     """calculate total resistance of two resistors in series."""
     return r1 + r2
 
 
+@jit(TWO_FLOATS)
 def resParallel(r1, r2):
     """calculate total resistance of two resistors in parallel."""
     return (r1 * r2) / (r1 + r2)
 
 
+@jit(TWO_FLOATS)
 def rcTimeConst(r, c):
     """calculate RC time constant tau = R * C."""
     return r * c
 
+
+if HAVE_NUMBA:
+    @njit("float64[:](float64[:], float64[:])", cache=True, fastmath=True, parallel=True)
+    def resFrq_arr(indH_arr, capF_arr):
+        """resonant frequency for every pair in two arrays of L and C values."""
+        out = np.empty(indH_arr.shape[0])
+        for i in prange(indH_arr.shape[0]):
+            out[i] = resFrq(indH_arr[i], capF_arr[i])
+        return out
+
+    @njit("Tuple((float64[:], float64[:], float64[:]))(float64[:], float64[:], float64[:])",
+          cache=True, fastmath=True, parallel=True)
+    def rlc_arr(indH_arr, capF_arr, resOhm_arr):
+        """rlc() for every set of values in three arrays of L, C and R values."""
+        count = indH_arr.shape[0]
+        resHz = np.empty(count)
+        qFac = np.empty(count)
+        bandHz = np.empty(count)
+        for i in prange(count):
+            freq, quality, width = rlc(indH_arr[i], capF_arr[i], resOhm_arr[i])
+            resHz[i] = freq
+            qFac[i] = quality
+            bandHz[i] = width
+        return resHz, qFac, bandHz
+else:
+    def resFrq_arr(indH_arr, capF_arr):
+        """resonant frequency for every pair in two lists of L and C values."""
+        return [resFrq(indH, capF) for indH, capF in zip(indH_arr, capF_arr)]
+
+    def rlc_arr(indH_arr, capF_arr, resOhm_arr):
+        """rlc() for every set of values in three lists of L, C and R values."""
+        results = [rlc(indH, capF, resOhm)
+                   for indH, capF, resOhm in zip(indH_arr, capF_arr, resOhm_arr)]
+        return tuple(list(column) for column in zip(*results))
+
+
+def trunc2(val):
+    """truncate a result to two decimal places for display."""
+    return math.floor(val * 100) / 100
+
 """-------"""
 
 
+MENU = ("\nMain Menu (q to quit)\n"
+        "1: series resonant circuit calculator\n"
+        "2: two resistors in series\n"
+        "3: two resistors in parallel\n"
+        "4: RC time constant\n"
+        "5: resonant frequency of series RLC\n\n")
+
+
 def menu():
-    print("\nMain Menu (q to quit)")
-    print("1: series resonant circuit calculator")
-    print("2: two resistors in series")
-    print("3: two resistors in parallel")
-    print("4: RC time constant")
-    print("5: resonant frequency of series RLC\n")
+    sys.stdout.write(MENU)
+
+
+def run_rlc(label, hint=True):
+    """series resonant circuit calculator, loops until getComp raises.
+
+    without the hint the results start after a blank line instead, as option 5 always did.
+    """
+    while True:
+        indMh = getComp("inductance in mH")
+        capUf = getComp("capacitance in uF")
+        resOhm = getComp("resistance in ohms")
+
+        indH = cnvUnt(indMh, -3)
+        capF = cnvUnt(capUf, -6)
+
+        resHz, qFac, bandHz = rlc(indH, capF, resOhm)
+
+        resHz = trunc2(resHz)
+        qFac = trunc2(qFac)
+        bandHz = trunc2(bandHz)
+
+        if hint:
+            menuHint()
+            lead = ""
+        else:
+            lead = "\n"
+        print(f"{lead}{label} component values: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n\n"
+              f"resonant freq: {resHz:.2f} Hz\n\n"
+              f"Q factor: {qFac:.2f}\n\n"
+              f"bandwidth: {bandHz:.2f} Hz\n")
+
+
+def run_two_r(calc, label):
+    """two resistor calculator using calc to combine them, loops until getComp raises."""
+    while True:
+        r1 = getComp("first resistor in ohms")
+        r2 = getComp("second resistor in ohms")
+
+        total = calc(r1, r2)
+        total = trunc2(total)
+
+        menuHint()
+        print(f"{label} resistance: {total:.2f} Ω\n")
+
+
+def run_rc():
+    """RC time constant calculator, loops until getComp raises."""
+    while True:
+        r = getComp("resistor in ohms")
+        cUf = getComp("capacitance in uF")
+
+        cF = cnvUnt(cUf, -6)
+        tau = rcTimeConst(r, cF)
+        tau = trunc2(tau)
+
+        menuHint()
+        print(f"RC time constant: {tau:.2f} seconds\n")
 
 
 # one time start up message
@@ -103,10 +262,9 @@ print("Multi-mode circuit calculator\n(q to quit)\n")
 
 # tells the user which version they have
 def versionYell(times, day):
-    count = 0
-    while count < times:
-        print("This is the day "+str(day)+" version!")
-        count += 1
+    message = f"This is the day {day} version!"
+    for _ in range(times):
+        print(message)
 
 versionYell(3, 5)
 
@@ -120,130 +278,29 @@ while True:
     if choice == "q":
         break
     
-    if choice == "1":
-        while True:
-            indMh = getComp("inductance in mH")
-            if indMh in ["menu", "q"]:
-                if indMh == "q": quit()
-                break
-            capUf = getComp("capacitance in uF")
-            if capUf in ["menu", "q"]:
-                if capUf == "q": quit()
-                break
-            resOhm = getComp("resistance in ohms")
-            if resOhm in ["menu", "q"]:
-                if resOhm == "q": quit()
-                break
-
-            indH = cnvUnt(indMh, -3)
-            capF = cnvUnt(capUf, -6)
-
-            resHz = resFrq(indH, capF)
-            qFac = qFact(indH, resOhm, capF)
-            bandHz = band(resHz, qFac)
-
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+    try:
+        if choice == "1":
+            run_rlc("LCR")
 
-            menuHint()
-            print(f"LCR component values: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
-            menuHint()
-            print(f"resonant freq: {resHz} Hz\n")
-            menuHint()
-            print(f"Q factor: {qFac}\n")
-            menuHint()
-            print(f"bandwidth: {bandHz} Hz\n")
-
-    elif choice == "2":
-        while True:
-            r1 = getComp("first resistor in ohms")
-            if r1 in ["menu", "q"]:
-                if r1 == "q": quit()
-                break
-            r2 = getComp("second resistor in ohms")
-            if r2 in ["menu", "q"]:
-                if r2 == "q": quit()
-                break
-
-            total = resSeries(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+        elif choice == "2":
+            run_two_r(resSeries, "series")
 
-            menuHint()
-            print(f"series resistance: {total} Ω\n")
-
-    elif choice == "3":
-        while True:
-            r1 = getComp("first resistor in ohms")
-            if r1 in ["menu", "q"]:
-                if r1 == "q": quit()
-                break
-            r2 = getComp("second resistor in ohms")
-            if r2 in ["menu", "q"]:
-                if r2 == "q": quit()
-                break
-
-            total = resParallel(r1, r2)
-            total = Decimal(total).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+        elif choice == "3":
+            run_two_r(resParallel, "parallel")
 
-            menuHint()
-            print(f"parallel resistance: {total} Ω\n")
-
-    elif choice == "4":
-        while True:
-            r = getComp("resistor in ohms")
-            if r in ["menu", "q"]:
-                if r == "q": quit()
-                break
-            cUf = getComp("capacitance in uF")
-            if cUf in ["menu", "q"]:
-                if cUf == "q": quit()
-                break
-
-            cF = cnvUnt(cUf, -6)
-            tau = rcTimeConst(r, cF)
-            tau = Decimal(tau).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+        elif choice == "4":
+            run_rc()
+
+        elif choice == "5":
+            run_rlc("RLC", hint=False)
 
+        else:
             menuHint()
-            print(f"RC time constant: {tau} seconds\n")
-
-    elif choice == "5":
-        while True:
-            indMh = getComp("inductance in mH")
-            if indMh in ["menu", "q"]:
-                if indMh == "q": quit()
-                break
-            capUf = getComp("capacitance in uF")
-            if capUf in ["menu", "q"]:
-                if capUf == "q": quit()
-                break
-            resOhm = getComp("resistance in ohms")
-            if resOhm in ["menu", "q"]:
-                if resOhm == "q": quit()
-                break
-
-            indH = cnvUnt(indMh, -3)
-            capF = cnvUnt(capUf, -6)
-
-            resHz = resFrq(indH, capF)
-            qFac = qFact(indH, resOhm, capF)
-            bandHz = band(resHz, qFac)
-
-            resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-            bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-
-            
-            print(f"\nRLC component values: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
-            
-            print(f"resonant freq: {resHz} Hz\n")
-            
-            print(f"Q factor: {qFac}\n")
-            
-            print(f"bandwidth: {bandHz} Hz\n")
-
-    else:
-        menuHint()
-        print("invalid choice, please select 1, 2, 3, 4, 5.\n")
+            print("invalid choice, please select 1, 2, 3, 4, 5.\n")
+
+    except MenuReturn:
+        continue
+    except QuitRequested:
+        break
 
 """-------"""
@@ -13,6 +13,14 @@ Student ID: 100777741
 import socket
 import json
 import sys
+import ipaddress
+
+# orjson is a faster C JSON parser that reads bytes directly, use it if installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # default server configuration
 DEFAULT_SERVER_IP = '192.168.18.111'  # change this to the Raspberry Pi server's IP
@@ -23,14 +31,27 @@ def validate_ip(ip):
     Validate if string is a valid IPv4 address
     Returns: True if valid, False otherwise
     """
-    parts = ip.split('.')
-    if len(parts) != 4:
-        return False
     try:
-        return all(0 <= int(part) <= 255 for part in parts)
+        ipaddress.IPv4Address(ip)
+        return True
     except ValueError:
         return False
 
+def recv_exact(s, size):
+    """
+    Read exactly size bytes from the socket
+    Returns: bytearray of the data, shorter than size if the server closed early
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = s.recv_into(view[received:])
+        if count == 0:
+            return buffer[:received]
+        received += count
+    return buffer
+
 def attempt_connection(host, port):
     """
     Attempt to connect to server and retrieve data
@@ -49,18 +70,22 @@ def attempt_connection(host, port):
         print(f"Connected successfully to {host}:{port}")
         print("=" * 60)
         
-        # receive data from server
+        # receive data from server, the first 4 bytes hold the message length
         print("\nReceiving data from server...")
-        data_received = s.recv(1024)
+        header = recv_exact(s, 4)
         
         # check if received any data
-        if not data_received:
+        if len(header) < 4:
             return False, "No data received from server"
         
-        # read JSON
+        message_length = int.from_bytes(header, 'big')
+        data_received = recv_exact(s, message_length)
+        if len(data_received) < message_length:
+            return False, "Incomplete data received from server"
+        
+        # read JSON straight from the received bytes
         try:
-            json_string = data_received.decode('utf-8')
-            data = json.loads(json_string)
+            data = json_loads(data_received)
             return True, data
             
         except json.JSONDecodeError as e:
@@ -10,16 +10,23 @@ Student ID: 100777741
 """
 
 import socket
-import os
 import time
 import json
 import signal
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Global flag for clean shutdown
 running = True
 
+# how long a vcgencmd result is reused before running the command again
+VCGENCMD_CACHE_SECONDS = 0.5
+vcgencmd_cache = {}
+
+# worker threads so the vcgencmd calls for a client run at the same time
+metric_pool = ThreadPoolExecutor(max_workers=5)
+
 def get_server_ip():
     """
     get all the server's IP address(es) on the local network
@@ -59,6 +66,20 @@ def signal_handler(sig, frame):
 # time to register signal handler
 signal.signal(signal.SIGINT, signal_handler)
 
+def vcgencmd(*args):
+    """
+    run vcgencmd directly (no shell) with the given arguments
+    results are reused for VCGENCMD_CACHE_SECONDS so back to back clients don't re-run it
+    returns: the command's output text
+    """
+    now = time.monotonic()
+    cached = vcgencmd_cache.get(args)
+    if cached and now - cached[0] < VCGENCMD_CACHE_SECONDS:
+        return cached[1]
+    output = subprocess.run(('vcgencmd',) + args, capture_output=True, text=True, timeout=1).stdout
+    vcgencmd_cache[args] = (now, output)
+    return output
+
 def get_core_temperature():
     """
     made to get the core temperature of the Raspberry Pi
@@ -66,9 +87,9 @@ def get_core_temperature():
     source: https://www.tomshardware.com/how-to/raspberry-pi-benchmark-vcgencmd
     """
     try:
-        temp_str = os.popen('vcgencmd measure_temp').readline()
-        # convert 'temp=42.8'C' to get the numeric value
-        temp_value = float(temp_str.replace("temp=", "").replace("'C", "").strip())
+        temp_str = vcgencmd('measure_temp')
+        # slice the number out of 'temp=42.8'C'
+        temp_value = float(temp_str.rstrip()[5:-2])
         return round(temp_value, 1)
     except Exception as e:
         print(f"Error getting temperature: {e}")
@@ -81,9 +102,9 @@ def get_core_voltage():
     source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        volt_str = os.popen('vcgencmd measure_volts core').readline()
-        # converting 'volt=1.2000V' to get the numeric value
-        volt_value = float(volt_str.replace("volt=", "").replace("V", "").strip())
+        volt_str = vcgencmd('measure_volts', 'core')
+        # slice the number out of 'volt=1.2000V'
+        volt_value = float(volt_str.rstrip()[5:-1])
         return round(volt_value, 2)
     except Exception as e:
         print(f"Error getting core voltage: {e}")
@@ -96,9 +117,9 @@ def get_arm_frequency():
     source: https://forums.raspberrypi.com/viewtopic.php?t=245733
     """
     try:
-        freq_str = os.popen('vcgencmd measure_clock arm').readline()
+        freq_str = vcgencmd('measure_clock', 'arm')
         # Parse 'frequency(48)=600000000' to get the numeric value
-        freq_value = int(freq_str.split('=')[1].strip())
+        freq_value = int(freq_str[freq_str.index('=') + 1:])
         # Convert Hz to MHz
         freq_mhz = freq_value // 1000000
         return freq_mhz
@@ -113,9 +134,9 @@ def get_gpu_memory():
     source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        mem_str = os.popen('vcgencmd get_mem gpu').readline()
-        # Parse 'gpu=128M' to get the numeric value
-        mem_value = int(mem_str.replace("gpu=", "").replace("M", "").strip())
+        mem_str = vcgencmd('get_mem', 'gpu')
+        # slice the number out of 'gpu=128M'
+        mem_value = int(mem_str.rstrip()[4:-1])
         return mem_value
     except Exception as e:
         print(f"Error getting GPU memory: {e}")
@@ -128,9 +149,9 @@ def get_throttled_status():
     source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        throttle_str = os.popen('vcgencmd get_throttled').readline()
+        throttle_str = vcgencmd('get_throttled')
         # Parse 'throttled=0x0' to get the hex value
-        throttle_value = throttle_str.replace("throttled=", "").strip()
+        throttle_value = throttle_str.rstrip()[10:]
         
         # Interpret the value (0x0 means no issues)
         if throttle_value == "0x0":
@@ -181,17 +202,20 @@ def main():
             try:
                 # try to accept client connection
                 c, addr = s.accept()
+                # small one-shot messages, don't let Nagle hold them back
+                c.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 print(f'\nGot connection from {addr[0]}:{addr[1]}')
                 
-                # collect all the cool system information
-                json_data = {
-                    "core_temperature_c": get_core_temperature(),
-                    "core_voltage_v": get_core_voltage(),
-                    "arm_frequency_mhz": get_arm_frequency(),
-                    "gpu_memory_mb": get_gpu_memory(),
-                    "throttled_status": get_throttled_status(),
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                # collect all the cool system information in parallel
+                futures = {
+                    "core_temperature_c": metric_pool.submit(get_core_temperature),
+                    "core_voltage_v": metric_pool.submit(get_core_voltage),
+                    "arm_frequency_mhz": metric_pool.submit(get_arm_frequency),
+                    "gpu_memory_mb": metric_pool.submit(get_gpu_memory),
+                    "throttled_status": metric_pool.submit(get_throttled_status)
                 }
+                json_data = {key: future.result() for key, future in futures.items()}
+                json_data["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
                 
                 # convert to JSON string and then to bytes
                 json_string = json.dumps(json_data, indent=2)
@@ -202,8 +226,8 @@ def main():
                 print(json_string)
                 print(f"Total bytes: {len(json_bytes)}")
                 
-                # send data to client
-                c.send(json_bytes)
+                # send data to client, prefixed with its 4 byte length
+                c.sendall(len(json_bytes).to_bytes(4, 'big') + json_bytes)
                 print("\nData sent successfully!")
                 
                 # suddenly close client connection
@@ -7,7 +7,9 @@ This example takes the temperature from the Pico's onboard temperature sensor, a
 It now toggles between Celsius and Fahrenheit when any button is pressed.
 """
 import machine
+import micropython
 import time
+from array import array
 from machine import Pin
 from pimoroni import RGBLED
 from picographics import PicoGraphics, DISPLAY_PICO_DISPLAY
@@ -38,61 +40,157 @@ button_y = Pin(15, Pin.IN, Pin.PULL_UP)
 # Temp conversion settings
 conversion_factor = 3.3 / (65535)
 
+# 27 - (raw * conversion_factor - 0.706) / 0.001721 in hundredths of a degree,
+# rearranged to OFFSET - raw * SLOPE with both constants in Q13 fixed point
+TEMP_Q = 13
+TEMP_OFFSET_Q = round((27 + 0.706 / 0.001721) * 100 * (1 << TEMP_Q))
+TEMP_SLOPE_Q = round(conversion_factor / 0.001721 * 100 * (1 << TEMP_Q))
+
 temp_min = 10
 temp_max = 30
 bar_width = 5
 
-temperatures = []
 
 colors = [(0, 0, 255), (0, 255, 0), (255, 255, 0), (255, 0, 0)]
 
 # Flag to toggle display mode
 display_in_celsius = True
 
+# All four buttons are in the RP2040 SIO GPIO_IN register (0xD0000004), so one read
+# gets them all. They are pulled up, so every bit in BUTTON_MASK is set while nothing is pressed.
+BUTTON_MASK = (1 << 12) | (1 << 13) | (1 << 14) | (1 << 15)
+
+@micropython.viper
+def read_buttons() -> int:
+    return int(ptr32(0xD0000004)[0]) & int(BUTTON_MASK)
+
 # Function to detect any button press
 def any_button_pressed():
-    return (not button_a.value() or
-            not button_b.value() or
-            not button_x.value() or
-            not button_y.value())
+    return read_buttons() != BUTTON_MASK
 
 # Function to convert C to F
 def c_to_f(temp_c):
     return temp_c * 9 / 5 + 32
 
-def temperature_to_color(temp):
-    temp = min(temp, temp_max)
-    temp = max(temp, temp_min)
-
-    f_index = float(temp - temp_min) / float(temp_max - temp_min)
-    f_index *= len(colors) - 1
-    index = int(f_index)
-
-    if index == len(colors) - 1:
-        return colors[index]
-
-    blend_b = f_index - index
-    blend_a = 1.0 - blend_b
-
-    a = colors[index]
-    b = colors[index + 1]
-
-    return [int((a[i] * blend_a) + (b[i] * blend_b)) for i in range(3)]
+# colour stops flattened to r, g, b bytes for the integer blend
+COLS = bytearray([c for rgb in colors for c in rgb])
+LAST_STOP = len(colors) - 1
+
+@micropython.native
+def temp_to_rgb(temp):
+    """Blend the colour stops with 8 bit fixed point, returns 0xRRGGBB."""
+    t = int(temp * 256)
+    if t < temp_min << 8:
+        t = temp_min << 8
+    elif t > temp_max << 8:
+        t = temp_max << 8
+
+    f = (t - (temp_min << 8)) * LAST_STOP // (temp_max - temp_min)
+    index = f >> 8
+    base = index * 3
+    if index == LAST_STOP:
+        return (COLS[base] << 16) | (COLS[base + 1] << 8) | COLS[base + 2]
+
+    frac = f & 0xFF
+    inv = 256 - frac
+    r = (COLS[base] * inv + COLS[base + 3] * frac) >> 8
+    g = (COLS[base + 1] * inv + COLS[base + 4] * frac) >> 8
+    b = (COLS[base + 2] * inv + COLS[base + 5] * frac) >> 8
+    return (r << 16) | (g << 8) | b
+
+# Pen lookup table so the bars don't need colour math or create_pen every frame.
+# RGB332 pens are a single byte, so the whole table is one 256 byte bytes object.
+LUT_SIZE = 256
+LUT_SCALE = (LUT_SIZE - 1) / (temp_max - temp_min)
+pens = bytearray(LUT_SIZE)
+for q in range(LUT_SIZE):
+    rgb = temp_to_rgb(temp_min + q / LUT_SCALE)
+    pens[q] = display.create_pen(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+PEN_LUT = bytes(pens)
+del pens
+
+@micropython.viper
+def read_temp_x100() -> int:
+    """Reads the sensor and returns the temperature in hundredths of a degree C."""
+    raw = int(sensor_temp.read_u16())
+    offset = int(TEMP_OFFSET_Q)
+    slope = int(TEMP_SLOPE_Q)
+    shift = int(TEMP_Q)
+    # shift by TEMP_Q, rounding to the nearest hundredth
+    return (offset - raw * slope + (1 << (shift - 1))) >> shift
+
+def temperature_to_lut_index(temp_x100):
+    q = (temp_x100 - temp_min * 100) * (LUT_SIZE - 1) // ((temp_max - temp_min) * 100)
+    if q < 0:
+        return 0
+    if q >= LUT_SIZE:
+        return LUT_SIZE - 1
+    return q
+
+# Temperature history in hundredths of a degree C as a circular buffer,
+# head is the next slot to write
+COLUMNS = WIDTH // bar_width
+temperatures = array('h', [temp_min * 100] * COLUMNS)
+head = 0
+filled = 0
+
+# What is currently drawn in each bar column, so only changed columns get repainted
+NOT_DRAWN = -32768
+shown_pen = bytearray(COLUMNS)
+shown_top = array('h', [NOT_DRAWN] * COLUMNS)
+
+# The display uses RGB332 pens, one byte per pixel, so the bar columns are
+# written straight into the framebuffer instead of through rectangle() calls
+FRAMEBUFFER = memoryview(display)
+
+@micropython.viper
+def draw_column(fb: ptr8, x: int, top: int, pen: int):
+    """Fill one bar column: background above top, pen from top to the bottom."""
+    stride = int(WIDTH)
+    height = int(HEIGHT)
+    width = int(bar_width)
+    background = int(BLACK)
+    if top < 0:
+        top = 0
+    if top > height:
+        top = height
+    y = 0
+    while y < height:
+        colour = background if y < top else pen
+        row = y * stride + x
+        i = 0
+        while i < width:
+            fb[row + i] = colour
+            i += 1
+        y += 1
+
+# The text box covers the left end of the bars
+TEXT_BOX_RIGHT = 131
+shown_key = None
+
+# Start from a blank screen, after this only changed regions are drawn
+display.set_pen(BLACK)
+display.clear()
 
 # Debounce variables
 last_button_state = False
 last_debounce_time = time.ticks_ms()
 debounce_delay = 200  # milliseconds
 
+# Frames are scheduled against the tick counter so the time spent drawing
+# doesn't stretch the period, leftover time in a frame is slept away
+FRAME_MS = 100
+next_tick = time.ticks_add(time.ticks_ms(), FRAME_MS)
+
 while True:
-    # Read temperature in Celsius
-    reading = sensor_temp.read_u16() * conversion_factor
-    temperature_c = 27 - (reading - 0.706) / 0.001721
+    # Read temperature in hundredths of a degree Celsius
+    temp_x100 = read_temp_x100()
 
     # Update temperature history
-    temperatures.append(temperature_c)
-    if len(temperatures) > WIDTH // bar_width:
-        temperatures.pop(0)
+    temperatures[head] = temp_x100
+    head = (head + 1) % COLUMNS
+    if filled < COLUMNS:
+        filled += 1
 
     # Debounce button press to toggle unit
     current_button_state = any_button_pressed()
@@ -103,31 +201,54 @@ while True:
 
     last_button_state = current_button_state
 
-    # Prepare the display
-    display.set_pen(BLACK)
-    display.clear()
-
-    i = 0
-    for t in temperatures:
-        color = temperature_to_color(t)
-        display.set_pen(display.create_pen(*color))
-        display.rectangle(i, HEIGHT - (round(t) * 4), bar_width, HEIGHT)
-        i += bar_width
-
-    led.set_rgb(*temperature_to_color(temperature_c))
-
-    # Draw white background for text
-    display.set_pen(WHITE)
-    display.rectangle(1, 1, 130, 75)
-
-    # Draw temperature as text
-    display.set_pen(BLACK)
-    if display_in_celsius:
-        display.text("{:.2f} C".format(temperature_c), 3, 3, 0, 5)
-    else:
-        temp_f = c_to_f(temperature_c)
-        display.text("{:.2f} F".format(temp_f), 3, 3, 0, 5)
-
-    display.update()
-
-    time.sleep(0.1)
+    # Repaint only the bar columns whose height or colour changed,
+    # dirty is set by any draw so an unchanged frame is never pushed to the screen
+    dirty = False
+    text_dirty = False
+    oldest = head - filled
+    for k in range(filled):
+        t = temperatures[(oldest + k) % COLUMNS]
+        pen = PEN_LUT[temperature_to_lut_index(t)]
+        # bar height is the reading rounded to whole degrees, 4 pixels each
+        top = HEIGHT - (((t + 50) // 100) << 2)
+        if shown_pen[k] != pen or shown_top[k] != top:
+            x = k * bar_width
+            draw_column(FRAMEBUFFER, x, top, pen)
+            shown_pen[k] = pen
+            shown_top[k] = top
+            dirty = True
+            if x < TEXT_BOX_RIGHT:
+                text_dirty = True
+
+    temperature_c = temp_x100 * 0.01
+    rgb = temp_to_rgb(temperature_c)
+    led.set_rgb(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+
+    # Only format and redraw the text when the reading or unit change,
+    # or a bar drew over the box
+    key = (display_in_celsius, temp_x100)
+    if text_dirty or key != shown_key:
+        if display_in_celsius:
+            value, unit = temperature_c, "C"
+        else:
+            value, unit = c_to_f(temperature_c), "F"
+        display.set_pen(WHITE)
+        display.rectangle(1, 1, TEXT_BOX_RIGHT - 1, 75)
+        display.set_pen(BLACK)
+        display.text("%.2f %s" % (value, unit), 3, 3, 0, 5)
+        shown_key = key
+        dirty = True
+
+    if dirty:
+        display.update()
+
+    slack = time.ticks_diff(next_tick, time.ticks_ms())
+    if slack > 5:
+        machine.lightsleep(slack - 2)
+        slack = time.ticks_diff(next_tick, time.ticks_ms())
+    if slack > 0:
+        time.sleep_ms(slack)
+    next_tick = time.ticks_add(next_tick, FRAME_MS)
+    # Start again from now if a frame overran by more than a whole period
+    if time.ticks_diff(next_tick, time.ticks_ms()) < 0:
+        next_tick = time.ticks_add(time.ticks_ms(), FRAME_MS)
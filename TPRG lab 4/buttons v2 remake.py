@@ -10,12 +10,14 @@ when the dffrent buttons are pressed on the pico display module.
 
 """
 import time
+import machine
 from machine import Pin
 from picographics import PicoGraphics, DISPLAY_PICO_DISPLAY, PEN_P4
 from pimoroni import RGBLED
 
 # Global configuration
 TEXT_SIZE = 5  # Configurable text size 
+DEBOUNCE_MS = 200  # Ignore repeat presses of the same button inside this window
 
 # Defines the pen colors for the display module.
 # Note: cyan and magenta go unused.
@@ -45,61 +47,78 @@ button_b = Pin(13, Pin.IN, Pin.PULL_UP)
 button_x = Pin(14, Pin.IN, Pin.PULL_UP)
 button_y = Pin(15, Pin.IN, Pin.PULL_UP)
 
-def change_display_color(color_name, color_pen, led_r, led_g, led_b):
+def text_position(color_name):
+    """Returns the x, y that centres color_name on the screen."""
+    # Pico Display is 240x135 pixels
+    text_width = len(color_name) * 8 * TEXT_SIZE
+    text_x = (280 - text_width) // 2
+    text_y = (135 - 8 * TEXT_SIZE) // 2
+    return text_x, text_y
+
+# Everything each colour screen needs, worked out once at start up:
+# name: (fill pen, LED rgb, text x, text y, dark background)
+COLOR_TABLE = {}
+for name, pen, rgb, dark in (("RED", RED, (255, 0, 0), True),
+                             ("BLUE", BLUE, (0, 0, 255), True),
+                             ("GREEN", GREEN, (0, 255, 0), True),
+                             ("YELLOW", YELLOW, (255, 255, 0), False)):
+    text_x, text_y = text_position(name)
+    COLOR_TABLE[name] = (pen, rgb, text_x, text_y, dark)
+
+def change_display_color(color_name):
     """
     Changes the display to show a solid color with the color name as text,
     and sets the RGB LED to match the color.
     
     Arguments:
-        color_name: String name of the color (e.g., "RED", "BLUE")
-        color_pen: The pen color to fill the display with
-        led_r: Red component for LED (0-255)
-        led_g: Green component for LED (0-255)
-        led_b: Blue component for LED (0-255)
+        color_name: String name of the color, a key of COLOR_TABLE
     """
+    pen, led_rgb, text_x, text_y, dark = COLOR_TABLE[color_name]
+    
     # Set the RGB LED color
-    led.set_rgb(led_r, led_g, led_b)
+    led.set_rgb(*led_rgb)
     
     # Fill the display with the color
-    display.set_pen(color_pen)
+    display.set_pen(pen)
     display.clear()
     
-    # Set text color to contrast with background
     # Use white text for dark colors, black for light colors
-    if color_name in ["RED", "BLUE", "GREEN"]:
-        display.set_pen(WHITE)
-    else:
-        display.set_pen(BLACK)
-    
-    # Calculate text position (center of screen)
-    # Pico Display is 240x135 pixels
-    text_width = len(color_name) * 8 * TEXT_SIZE
-    text_x = (280 - text_width) // 2
-    text_y = (135 - 8 * TEXT_SIZE) // 2
+    display.set_pen(WHITE if dark else BLACK)
     
     # Draw the text
     display.text(color_name, text_x, text_y, scale=TEXT_SIZE)
     display.update()
 
+# Button presses are caught by interrupts, the handlers only set a flag
+# so the main loop never has to block in a debounce sleep
+last_press = [0, 0, 0, 0]
+pending = [False] * 4
+
+def mark_pressed(index):
+    """Flags button index as pressed if it is outside the debounce window."""
+    now = time.ticks_ms()
+    if time.ticks_diff(now, last_press[index]) > DEBOUNCE_MS:
+        last_press[index] = now
+        pending[index] = True
+
+button_a.irq(trigger=Pin.IRQ_FALLING, handler=lambda pin: mark_pressed(0))
+button_b.irq(trigger=Pin.IRQ_FALLING, handler=lambda pin: mark_pressed(1))
+button_x.irq(trigger=Pin.IRQ_FALLING, handler=lambda pin: mark_pressed(2))
+button_y.irq(trigger=Pin.IRQ_FALLING, handler=lambda pin: mark_pressed(3))
+
+# Colour shown by each button, in the same order as pending
+BUTTON_COLORS = ("RED", "BLUE", "GREEN", "YELLOW")
+shown_color = None
+
 while True:
-    # Check button A for RED
-    if button_a.value() == 0:
-        change_display_color("RED", RED, 255, 0, 0)
-        time.sleep(0.2)  # Debounce delay
-    
-    # Check button B for BLUE
-    if button_b.value() == 0:
-        change_display_color("BLUE", BLUE, 0, 0, 255)
-        time.sleep(0.2)  # Debounce delay
-    
-    # Check button X for GREEN
-    if button_x.value() == 0:
-        change_display_color("GREEN", GREEN, 0, 255, 0)
-        time.sleep(0.2)  # Debounce delay
-    
-    # Check button Y for YELLOW
-    if button_y.value() == 0:
-        change_display_color("YELLOW", YELLOW, 255, 255, 0)
-        time.sleep(0.2)  # Debounce delay
+    # A for RED, B for BLUE, X for GREEN, Y for YELLOW
+    for index, name in enumerate(BUTTON_COLORS):
+        if pending[index]:
+            pending[index] = False
+            # Pressing the colour already on screen changes nothing, so skip the redraw
+            if name != shown_color:
+                change_display_color(name)
+                shown_color = name
     
-    time.sleep(0.01)  # Small delay to stop spam writes
\ No newline at end of file
+    # Nothing to do until the next press, so sleep lightly to save power
+    machine.lightsleep(10)
@@ -27,19 +27,29 @@ Requirements:
 - Try/except error handling
 """
 
+import asyncio
+import ipaddress
+import logging
 import socket
-import os
+import struct
 import time
-import json
 import sys
 import platform
+import shutil
+import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 try:
     import FreeSimpleGUI as sg
 except ImportError:
     print("Error: FreeSimpleGUI module not found. Please install it first.")
     sys.exit(1)
 
+# Per-sample messages go through logging so they cost nothing unless enabled,
+# set the level to logging.DEBUG to see every iteration
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
+
 
 # ============================================================================
 # CONFIGURATION
@@ -49,10 +59,26 @@ DEFAULT_PORT = 5000
 MAX_ITERATIONS = 50
 SAMPLE_INTERVAL = 2  # seconds
 
+# Unicode LED symbols
+LED_OFF = '⚫'  # Black circle
+LED_ON = '🟢'
+LED_FLASH_MS = 100  # how long the LED stays on for each batch sent
+SAMPLE_QUEUE_SIZE = 8  # samples waiting to be sent before the sampler blocks
+BATCH_SIZE = 5  # samples sent together in one write
+BATCH_BUFFER_SIZE = BATCH_SIZE * 256  # bytes, an encoded sample is about 190
+
 
 # ============================================================================
 # PLATFORM CHECK
 # ============================================================================
+# /proc/cpuinfo does not change while running, so it is only read once
+try:
+    with open('/proc/cpuinfo', 'r') as f:
+        CPUINFO = f.read()
+except FileNotFoundError:
+    CPUINFO = None
+
+
 def check_platform():
     """
     Check if running on Raspberry Pi. Exit gracefully if on PC.
@@ -69,23 +95,16 @@ def check_platform():
     is_pi = False
     
     # Method 1: Check /proc/cpuinfo for Raspberry Pi
-    try:
-        with open('/proc/cpuinfo', 'r') as f:
-            cpuinfo = f.read()
-            if 'Raspberry Pi' in cpuinfo or 'BCM' in cpuinfo:
-                is_pi = True
-                print("[PLATFORM CHECK] Raspberry Pi detected via /proc/cpuinfo")
-    except FileNotFoundError:
+    if CPUINFO is None:
         print("[PLATFORM CHECK] /proc/cpuinfo not found")
+    elif 'Raspberry Pi' in CPUINFO or 'BCM' in CPUINFO:
+        is_pi = True
+        print("[PLATFORM CHECK] Raspberry Pi detected via /proc/cpuinfo")
     
     # Method 2: Check if vcgencmd exists (Pi-specific command)
-    try:
-        result = os.popen('which vcgencmd').read()
-        if result.strip():
-            is_pi = True
-            print("[PLATFORM CHECK] vcgencmd command found")
-    except Exception as e:
-        print(f"[PLATFORM CHECK] vcgencmd check failed: {e}")
+    if shutil.which('vcgencmd'):
+        is_pi = True
+        print("[PLATFORM CHECK] vcgencmd command found")
     
     # Method 3: Check architecture (ARM typically indicates Pi)
     if machine.startswith('arm') or machine.startswith('aarch'):
@@ -103,28 +122,106 @@ def check_platform():
 # ============================================================================
 # VCGENCMD DATA COLLECTION FUNCTIONS
 # ============================================================================
-def get_core_temperature():
+# Core temperature and ARM frequency are read straight from sysfs, which is a
+# small file read instead of starting a process. The files are opened once per
+# session by ClientThread and re-read from the start each sample.
+TEMP_SYSFS = '/sys/class/thermal/thermal_zone0/temp'  # millidegrees C
+FREQ_SYSFS = '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq'  # kHz
+
+# The rest have no sysfs file and come from vcgencmd. Each vcgencmd runs as its
+# own process (no shell) and the commands in a group run at the same time.
+# Voltage moves every sample, throttling rarely changes so it is only re-read
+# every STATIC_REFRESH_EVERY iterations.
+# GPU memory is fixed at boot and is read once per session by ClientThread.
+FAST_COMMANDS = (("vcgencmd", "measure_volts", "core"),)
+SLOW_COMMANDS = (("vcgencmd", "get_throttled"),)
+GPU_MEMORY_COMMAND = ("vcgencmd", "get_mem", "gpu")
+STATIC_REFRESH_EVERY = 10
+
+# Worker threads so the vcgencmd calls in a group run at the same time
+vcgen_pool = ThreadPoolExecutor(max_workers=len(FAST_COMMANDS) + len(SLOW_COMMANDS))
+
+
+def open_sysfs(path):
     """
-    Get the core temperature of the Raspberry Pi.
+    Open a sysfs file for repeated reading.
     
+    Args:
+        path (str): Path of the sysfs file
+        
     Returns:
-        float: Temperature in Celsius (1 decimal place)
+        file: Unbuffered binary file, or None if it could not be opened
+    """
+    try:
+        return open(path, 'rb', buffering=0)
+    except OSError as e:
+        log.warning("[ERROR] Opening %s: %s", path, e)
+        return None
+
+
+def read_sysfs_int(sysfs_file):
+    """
+    Read the integer value of an open sysfs file from the start.
+    
+    Returns:
+        int: Current value of the file
+    """
+    sysfs_file.seek(0)
+    return int(sysfs_file.read())
+
+
+def run_vcgen_command(command):
+    """
+    Run one vcgencmd command.
+    
+    Args:
+        command (tuple): Program and arguments
         
-    Source: https://www.tomshardware.com/how-to/raspberry-pi-benchmark-vcgencmd
+    Returns:
+        str: First line of output, empty if the command could not run
     """
     try:
-        temp_str = os.popen('vcgencmd measure_temp').readline()
-        # Parse 'temp=42.8'C' to get the numeric value
-        temp_value = float(temp_str.replace("temp=", "").replace("'C", "").strip())
-        return round(temp_value, 1)
+        result = subprocess.run(command, capture_output=True, text=True)
+        return result.stdout.partition('\n')[0]
+    except OSError as e:
+        log.warning("[ERROR] Running vcgencmd: %s", e)
+        return ''
+
+
+def read_vcgen_batch(commands):
+    """
+    Run a group of vcgencmd commands in parallel.
+    
+    Args:
+        commands (tuple): Commands to run, each a tuple of program and arguments
+        
+    Returns:
+        list: One output line per command, in the same order
+    """
+    return list(vcgen_pool.map(run_vcgen_command, commands))
+
+
+def read_core_temperature(temp_file):
+    """
+    Read the core temperature from the thermal zone sysfs file.
+    
+    Args:
+        temp_file: File opened on TEMP_SYSFS, or None
+        
+    Returns:
+        float: Temperature in Celsius (1 decimal place)
+    """
+    try:
+        # The file holds millidegrees, e.g. '42842'
+        return round(read_sysfs_int(temp_file) / 1000, 1)
     except Exception as e:
-        print(f"[ERROR] Getting temperature: {e}")
+        log.warning("[ERROR] Getting temperature: %s", e)
         return 0.0
 
 
-def get_core_voltage():
+def parse_core_voltage(volt_str):
     """
-    Get the core voltage of the Raspberry Pi.
+    Parse the core voltage from vcgencmd measure_volts core output.
     
     Returns:
         float: Voltage in volts (1 decimal place)
@@ -132,39 +229,35 @@ def get_core_voltage():
     Source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        volt_str = os.popen('vcgencmd measure_volts core').readline()
         # Parse 'volt=1.2000V' to get the numeric value
-        volt_value = float(volt_str.replace("volt=", "").replace("V", "").strip())
+        volt_value = float(volt_str.partition('=')[2].rstrip("V\n "))
         return round(volt_value, 1)
     except Exception as e:
-        print(f"[ERROR] Getting core voltage: {e}")
+        log.warning("[ERROR] Getting core voltage: %s", e)
         return 0.0
 
 
-def get_arm_frequency():
+def read_arm_frequency(freq_file):
     """
-    Get the ARM CPU frequency in MHz.
+    Read the ARM CPU frequency from the cpufreq sysfs file.
     
+    Args:
+        freq_file: File opened on FREQ_SYSFS, or None
+        
     Returns:
         int: Frequency in MHz
-        
-    Source: https://forums.raspberrypi.com/viewtopic.php?t=245733
     """
     try:
-        freq_str = os.popen('vcgencmd measure_clock arm').readline()
-        # Parse 'frequency(48)=600000000' to get the numeric value
-        freq_value = int(freq_str.split('=')[1].strip())
-        # Convert Hz to MHz
-        freq_mhz = freq_value // 1000000
-        return freq_mhz
+        # The file holds kHz, e.g. '600000'
+        return read_sysfs_int(freq_file) // 1000
     except Exception as e:
-        print(f"[ERROR] Getting ARM frequency: {e}")
+        log.warning("[ERROR] Getting ARM frequency: %s", e)
         return 0
 
 
-def get_gpu_memory():
+def parse_gpu_memory(mem_str):
     """
-    Get the GPU memory allocation in MB.
+    Parse the GPU memory allocation from vcgencmd get_mem gpu output.
     
     Returns:
         int: GPU memory in MB
@@ -172,18 +265,18 @@ def get_gpu_memory():
     Source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        mem_str = os.popen('vcgencmd get_mem gpu').readline()
         # Parse 'gpu=128M' to get the numeric value
-        mem_value = int(mem_str.replace("gpu=", "").replace("M", "").strip())
+        mem_value = int(mem_str.partition('=')[2].rstrip("M\n "))
         return mem_value
     except Exception as e:
-        print(f"[ERROR] Getting GPU memory: {e}")
+        log.warning("[ERROR] Getting GPU memory: %s", e)
         return 0
 
 
-def get_throttled_status():
+def parse_throttled_status(throttle_str):
     """
-    Get the throttled status of the Raspberry Pi (indicates undervoltage/throttling).
+    Parse the throttled status from vcgencmd get_throttled output
+    (indicates undervoltage/throttling).
     
     Returns:
         str: Status string
@@ -191,9 +284,8 @@ def get_throttled_status():
     Source: https://www.nicm.dev/vcgencmd/
     """
     try:
-        throttle_str = os.popen('vcgencmd get_throttled').readline()
         # Parse 'throttled=0x0' to get the hex value
-        throttle_value = throttle_str.replace("throttled=", "").strip()
+        throttle_value = throttle_str.partition('=')[2].strip()
         
         # Interpret the value (0x0 means no issues)
         if throttle_value == "0x0":
@@ -203,32 +295,74 @@ def get_throttled_status():
         
         return status
     except Exception as e:
-        print(f"[ERROR] Getting throttled status: {e}")
+        log.warning("[ERROR] Getting throttled status: %s", e)
         return "Unknown"
 
 
-def collate_vcgen_data(iteration):
+def collate_vcgen_data(iteration, gpu_memory_mb, temp_file, freq_file, static_cache):
     """
     Collate all vcgencmd data into a dictionary.
     
     Args:
         iteration (int): Current iteration number
+        gpu_memory_mb (int): GPU memory read once at the start of the session
+        temp_file: File opened on TEMP_SYSFS, or None
+        freq_file: File opened on FREQ_SYSFS, or None
+        static_cache (dict): Last readings of the SLOW_COMMANDS metrics this session
         
     Returns:
         dict: Dictionary containing all sensor data and iteration count
     """
+    if not static_cache or iteration % STATIC_REFRESH_EVERY == 0:
+        # Refresh the slow metrics alongside the fast ones
+        volt_line, throttle_line = read_vcgen_batch(FAST_COMMANDS + SLOW_COMMANDS)
+        static_cache["throttled_status"] = parse_throttled_status(throttle_line)
+    else:
+        volt_line, = read_vcgen_batch(FAST_COMMANDS)
+    
     data = {
         "iteration": iteration,
-        "core_temperature_c": get_core_temperature(),
-        "core_voltage_v": get_core_voltage(),
-        "arm_frequency_mhz": get_arm_frequency(),
-        "gpu_memory_mb": get_gpu_memory(),
-        "throttled_status": get_throttled_status(),
+        "core_temperature_c": read_core_temperature(temp_file),
+        "core_voltage_v": parse_core_voltage(volt_line),
+        "arm_frequency_mhz": read_arm_frequency(freq_file),
+        "gpu_memory_mb": gpu_memory_mb,
+        "throttled_status": static_cache["throttled_status"],
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
     }
     return data
 
 
+# The sample always has the same keys, so it is encoded by filling in this
+# template rather than walking the dict with a JSON encoder. The two strings
+# are made by this module (status text and timestamp) and never need escaping.
+JSON_TEMPLATE = (b'{"iteration":%d,"core_temperature_c":%.1f,"core_voltage_v":%.1f,'
+                 b'"arm_frequency_mhz":%d,"gpu_memory_mb":%d,'
+                 b'"throttled_status":"%s","timestamp":"%s"}')
+
+# Every message on the wire starts with its length as 4 bytes, big endian
+HEADER = struct.Struct('>I')
+HEADER_SIZE = HEADER.size
+
+
+def encode_sample(data):
+    """
+    Encode a collate_vcgen_data dictionary as compact JSON.
+    
+    Args:
+        data (dict): Dictionary from collate_vcgen_data
+        
+    Returns:
+        bytes: JSON object as UTF-8 bytes
+    """
+    return JSON_TEMPLATE % (data["iteration"],
+                            data["core_temperature_c"],
+                            data["core_voltage_v"],
+                            data["arm_frequency_mhz"],
+                            data["gpu_memory_mb"],
+                            data["throttled_status"].encode('ascii'),
+                            data["timestamp"].encode('ascii'))
+
+
 # ============================================================================
 # CONNECTION MANAGEMENT
 # ============================================================================
@@ -242,18 +376,16 @@ def validate_ip(ip):
     Returns:
         bool: True if valid IPv4 address, False otherwise
     """
-    parts = ip.split('.')
-    if len(parts) != 4:
-        return False
     try:
-        return all(0 <= int(part) <= 255 for part in parts)
+        ipaddress.IPv4Address(ip)
+        return True
     except ValueError:
         return False
 
 
-def test_server_connection(ip, port, timeout=3):
+def open_server_connection(ip, port, timeout=3):
     """
-    Test connection to server without sending data.
+    Connect to the server and keep the socket open for sending data.
     
     Args:
         ip (str): Server IP address
@@ -261,44 +393,41 @@ def test_server_connection(ip, port, timeout=3):
         timeout (int): Connection timeout in seconds
         
     Returns:
-        tuple: (success: bool, message: str)
+        tuple: (success: bool, message: str, sock: socket.socket or None)
     """
     print(f"\n[CONNECTION TEST] Attempting to connect to {ip}:{port}")
     print(f"[CONNECTION TEST] Timeout: {timeout} seconds")
     
     try:
-        # Create test socket
-        test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        test_socket.settimeout(timeout)
-        
         # Attempt connection
-        test_socket.connect((ip, port))
-        test_socket.close()
+        sock = socket.create_connection((ip, port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         
         print(f"[CONNECTION TEST] ✓ Successfully connected to {ip}:{port}")
-        return True, f"Connection successful to {ip}:{port}"
+        return True, f"Connection successful to {ip}:{port}", sock
         
     except ConnectionRefusedError:
         error_msg = f"Connection refused by {ip}:{port}"
         print(f"[CONNECTION TEST] ✗ {error_msg}")
         print("[CONNECTION TEST] Server may not be running")
-        return False, error_msg
+        return False, error_msg, None
         
     except socket.timeout:
         error_msg = f"Connection timeout to {ip}:{port}"
         print(f"[CONNECTION TEST] ✗ {error_msg}")
         print("[CONNECTION TEST] Server did not respond in time")
-        return False, error_msg
+        return False, error_msg, None
         
     except socket.gaierror as e:
         error_msg = f"Cannot resolve address {ip}"
         print(f"[CONNECTION TEST] ✗ {error_msg}: {e}")
-        return False, error_msg
+        return False, error_msg, None
         
     except Exception as e:
         error_msg = f"Connection error: {str(e)}"
         print(f"[CONNECTION TEST] ✗ {error_msg}")
-        return False, error_msg
+        return False, error_msg, None
 
 
 def show_connection_dialog(default_ip, port):
@@ -382,21 +511,18 @@ def show_connection_dialog(default_ip, port):
     return should_connect, selected_ip
 
 
-def show_connection_failed_dialog(ip, port, error_message):
+# The failure and IP input dialogs can come up many times while retrying, so each
+# is built once on first use and then hidden/shown instead of rebuilt
+dialog_windows = {}
+
+
+def make_failed_window():
     """
-    Show dialog when connection fails, offering retry options.
+    Build the connection failed dialog (hidden until shown).
     
-    Args:
-        ip (str): IP address that failed
-        port (int): Port number
-        error_message (str): Error message to display
-        
     Returns:
-        str: User choice - 'retry', 'change', or 'quit'
+        sg.Window: FreeSimpleGUI window object
     """
-    print(f"\n[CONNECTION FAILED] Showing failure dialog for {ip}:{port}")
-    print(f"[CONNECTION FAILED] Error: {error_message}")
-    
     sg.theme('DarkBlue3')
     
     layout = [
@@ -404,10 +530,10 @@ def show_connection_failed_dialog(ip, port, error_message):
                  text_color='red')],
         [sg.HorizontalSeparator()],
         [sg.Text('Failed to connect to server:', pad=(0, 10))],
-        [sg.Text(f'{ip}:{port}', font=('Courier', 11), text_color='cyan', 
-                 pad=(20, 5))],
+        [sg.Text('', key='-FAILED_ADDRESS-', size=(25, 1), font=('Courier', 11),
+                 text_color='cyan', pad=(20, 5))],
         [sg.Text('Error:', pad=(20, 5))],
-        [sg.Multiline(error_message, size=(50, 3), disabled=True, 
+        [sg.Multiline('', key='-ERROR-', size=(50, 3), disabled=True, 
                      pad=(20, 5), background_color='#1a1a1a', text_color='white')],
         [sg.HorizontalSeparator()],
         [sg.Text('What would you like to do?', font=('Helvetica', 10, 'bold'), 
@@ -418,7 +544,98 @@ def show_connection_failed_dialog(ip, port, error_message):
                   button_color=('white', 'red'))]
     ]
     
-    window = sg.Window('Connection Failed', layout, modal=True, finalize=True)
+    window = sg.Window('Connection Failed', layout, finalize=True)
+    window.hide()
+    return window
+
+
+def make_ip_input_window():
+    """
+    Build the IP address input dialog (hidden until shown).
+    
+    Returns:
+        sg.Window: FreeSimpleGUI window object
+    """
+    sg.theme('DarkBlue3')
+    
+    layout = [
+        [sg.Text('ENTER SERVER IP ADDRESS', font=('Helvetica', 14, 'bold'))],
+        [sg.HorizontalSeparator()],
+        [sg.Text('', key='-PORT-', size=(15, 1), pad=(0, 10))],
+        [sg.Text('Current IP:', pad=(0, 5))],
+        [sg.Text('', key='-CURRENT_IP-', size=(20, 1), text_color='yellow', pad=(20, 5))],
+        [sg.HorizontalSeparator()],
+        [sg.Text('Enter new IP address:', pad=(0, 10))],
+        [sg.Input('', key='-NEW_IP-', size=(25, 1), focus=True)],
+        [sg.Text('Example: 192.168.1.100', font=('Helvetica', 9), 
+                 text_color='white', pad=(0, 5))],
+        [sg.HorizontalSeparator()],
+        [sg.Button('Connect', size=(15, 1), bind_return_key=True, key='-CONNECT-'),
+         sg.Button('Cancel', size=(15, 1), key='-CANCEL-')]
+    ]
+    
+    window = sg.Window('Enter IP Address', layout, finalize=True)
+    window.hide()
+    return window
+
+
+def get_dialog(name, make_window):
+    """
+    Get a cached dialog window, building it the first time or if it was closed.
+    
+    Args:
+        name (str): Key of the dialog in dialog_windows
+        make_window: Function that builds the window
+        
+    Returns:
+        sg.Window: FreeSimpleGUI window object
+    """
+    window = dialog_windows.get(name)
+    if window is None or window.was_closed():
+        window = make_window()
+        dialog_windows[name] = window
+    return window
+
+
+def show_dialog(window):
+    """Show a cached dialog and make it modal."""
+    window.un_hide()
+    window.make_modal()
+
+
+def hide_dialog(window):
+    """Hide a cached dialog and release its modal grab."""
+    if not window.was_closed():
+        window.TKroot.grab_release()
+        window.hide()
+
+
+def close_dialogs():
+    """Close all cached dialog windows."""
+    for window in dialog_windows.values():
+        window.close()
+    dialog_windows.clear()
+
+
+def show_connection_failed_dialog(ip, port, error_message):
+    """
+    Show dialog when connection fails, offering retry options.
+    
+    Args:
+        ip (str): IP address that failed
+        port (int): Port number
+        error_message (str): Error message to display
+        
+    Returns:
+        str: User choice - 'retry', 'change', or 'quit'
+    """
+    print(f"\n[CONNECTION FAILED] Showing failure dialog for {ip}:{port}")
+    print(f"[CONNECTION FAILED] Error: {error_message}")
+    
+    window = get_dialog('failed', make_failed_window)
+    window['-FAILED_ADDRESS-'].update(f'{ip}:{port}')
+    window['-ERROR-'].update(error_message)
+    show_dialog(window)
     
     choice = 'quit'
     
@@ -436,9 +653,7 @@ def show_connection_failed_dialog(ip, port, error_message):
             print("[CONNECTION FAILED] User chose to enter different IP")
     
     finally:
-        window.close()
-        # FIX: Allow GUI to process close event
-        time.sleep(0.1)
+        hide_dialog(window)
     
     return choice
 
@@ -456,25 +671,12 @@ def show_ip_input_dialog(current_ip, port):
     """
     print(f"\n[IP INPUT DIALOG] Prompting for new IP (current: {current_ip})")
     
-    sg.theme('DarkBlue3')
-    
-    layout = [
-        [sg.Text('ENTER SERVER IP ADDRESS', font=('Helvetica', 14, 'bold'))],
-        [sg.HorizontalSeparator()],
-        [sg.Text(f'Port: {port}', pad=(0, 10))],
-        [sg.Text('Current IP:', pad=(0, 5))],
-        [sg.Text(current_ip, text_color='yellow', pad=(20, 5))],
-        [sg.HorizontalSeparator()],
-        [sg.Text('Enter new IP address:', pad=(0, 10))],
-        [sg.Input(current_ip, key='-NEW_IP-', size=(25, 1), focus=True)],
-        [sg.Text('Example: 192.168.1.100', font=('Helvetica', 9), 
-                 text_color='white', pad=(0, 5))],
-        [sg.HorizontalSeparator()],
-        [sg.Button('Connect', size=(15, 1), bind_return_key=True, key='-CONNECT-'),
-         sg.Button('Cancel', size=(15, 1), key='-CANCEL-')]
-    ]
-    
-    window = sg.Window('Enter IP Address', layout, modal=True, finalize=True)
+    window = get_dialog('ip_input', make_ip_input_window)
+    window['-PORT-'].update(f'Port: {port}')
+    window['-CURRENT_IP-'].update(current_ip)
+    window['-NEW_IP-'].update(current_ip)
+    show_dialog(window)
+    window['-NEW_IP-'].set_focus()
     
     new_ip = None
     should_continue = False
@@ -502,9 +704,7 @@ def show_ip_input_dialog(current_ip, port):
                 break
     
     finally:
-        window.close()
-        # FIX: Allow GUI to process close event
-        time.sleep(0.1)
+        hide_dialog(window)
     
     return should_continue, new_ip
 
@@ -518,7 +718,7 @@ def establish_connection(default_ip, port):
         port (int): Server port
         
     Returns:
-        tuple: (success: bool, final_ip: str or None)
+        tuple: (success: bool, final_ip: str or None, sock: socket.socket or None)
     """
     print("\n" + "="*60)
     print("[CONNECTION WORKFLOW] Starting connection establishment")
@@ -529,16 +729,16 @@ def establish_connection(default_ip, port):
     
     if not should_connect:
         print("[CONNECTION WORKFLOW] User cancelled initial connection")
-        return False, None
+        return False, None, None
     
     # Connection retry loop
     while True:
         # Test connection
-        success, message = test_server_connection(current_ip, port)
+        success, message, sock = open_server_connection(current_ip, port)
         
         if success:
             print(f"[CONNECTION WORKFLOW] ✓ Successfully connected to {current_ip}:{port}")
-            return True, current_ip
+            return True, current_ip, sock
         
         # Connection failed - show options
         print(f"[CONNECTION WORKFLOW] ✗ Connection failed to {current_ip}:{port}")
@@ -546,7 +746,7 @@ def establish_connection(default_ip, port):
         
         if choice == 'quit':
             print("[CONNECTION WORKFLOW] User chose to quit")
-            return False, None
+            return False, None, None
             
         elif choice == 'retry':
             print(f"[CONNECTION WORKFLOW] Retrying connection to {current_ip}:{port}")
@@ -571,10 +771,11 @@ def establish_connection(default_ip, port):
 # ============================================================================
 class ClientThread(threading.Thread):
     """
-    Thread class to handle client communication without blocking the GUI.
+    Thread class that runs the asyncio event loop sending data to the server,
+    so neither sampling nor the network blocks the GUI.
     """
     
-    def __init__(self, server_ip, port, window):
+    def __init__(self, server_ip, port, window, sock=None):
         """
         Initialize client thread.
         
@@ -582,20 +783,42 @@ class ClientThread(threading.Thread):
             server_ip (str): Server IP address
             port (int): Server port
             window: FreeSimpleGUI window instance
+            sock (socket.socket): Already open server connection to reuse, if any
         """
         threading.Thread.__init__(self)
         self.server_ip = server_ip
         self.port = port
         self.window = window
-        self.running = True
+        self.sock = sock
+        self.writer = None
         self.daemon = True
         self.completed_iterations = 0
+        self.loop = asyncio.new_event_loop()
+        # stop() can run before the loop does, so the request is kept in a
+        # threading.Event and send_loop creates the asyncio.Event on the loop
+        self.stop_requested = threading.Event()
+        self.stop_event = None
+        
+        # Encoded samples are written into this one buffer until the batch is sent
+        self.batch_buffer = bytearray(BATCH_BUFFER_SIZE)
+        self.batch_length = 0
+        self.batch_count = 0
+        
+        # GPU memory is fixed at boot, so it is only read once per session
+        self.gpu_memory_mb = parse_gpu_memory(run_vcgen_command(GPU_MEMORY_COMMAND))
+        
+        # Last readings of the SLOW_COMMANDS metrics, empty so each session reads them fresh
+        self.static_cache = {}
+        
+        # sysfs files are opened once and re-read every sample
+        self.temp_file = open_sysfs(TEMP_SYSFS)
+        self.freq_file = open_sysfs(FREQ_SYSFS)
         
         print(f"\n[CLIENT THREAD] Initialized for {server_ip}:{port}")
     
     def run(self):
         """
-        Main thread execution - sends data to server.
+        Main thread execution - runs the event loop until sending is done.
         """
         print("[CLIENT THREAD] Starting data transmission")
         print(f"[CLIENT THREAD] Target: {self.server_ip}:{self.port}")
@@ -603,89 +826,240 @@ class ClientThread(threading.Thread):
         print(f"[CLIENT THREAD] Interval: {SAMPLE_INTERVAL} seconds\n")
         
         iteration = 0
+        failed = False
+        try:
+            iteration = self.loop.run_until_complete(self.send_loop())
+        except Exception as e:
+            # send_batch handles the connection errors it can retry, anything
+            # else (including a sampler error) ends the session
+            error_msg = f'Error after iteration {self.completed_iterations}: {str(e)}'
+            log.warning("[CLIENT THREAD] ✗ EXCEPTION: %s", error_msg)
+            self.window.write_event_value('-ERROR-', error_msg)
+            failed = True
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()
+            for sysfs_file in (self.temp_file, self.freq_file):
+                if sysfs_file is not None:
+                    sysfs_file.close()
         
-        while self.running and iteration < MAX_ITERATIONS:
-            try:
+        # Send completion event with actual iterations completed
+        if self.stop_requested.is_set():
+            # Stopped early by user
+            print(f"\n[CLIENT THREAD] Stopped after {self.completed_iterations} iterations")
+            self.window.write_event_value('-STOPPED-', self.completed_iterations)
+        elif not failed and iteration >= MAX_ITERATIONS:
+            # All iterations completed successfully
+            print(f"\n[CLIENT THREAD] ✓ Completed all {MAX_ITERATIONS} iterations")
+            self.window.write_event_value('-COMPLETE-', self.completed_iterations)
+        else:
+            # Ended by an error, -ERROR- already carries the reason
+            print(f"\n[CLIENT THREAD] Failed after {self.completed_iterations} iterations")
+            self.window.write_event_value('-FAILED-', self.completed_iterations)
+    
+    async def sample_loop(self, samples):
+        """
+        Collect MAX_ITERATIONS samples on a fixed interval and queue them,
+        so a slow or failed send never delays the next sample.
+        
+        Args:
+            samples (asyncio.Queue): Queue the collected data is put on
+        """
+        iteration = 0
+        try:
+            while not self.stop_event.is_set() and iteration < MAX_ITERATIONS:
                 iteration += 1
                 
-                print(f"[ITERATION {iteration}/{MAX_ITERATIONS}] Starting...")
+                # vcgencmd blocks, so it runs in the loop's worker thread
+                data = await asyncio.to_thread(collate_vcgen_data, iteration,
+                                               self.gpu_memory_mb,
+                                               self.temp_file, self.freq_file,
+                                               self.static_cache)
+                await samples.put(data)
                 
-                # Update status in GUI
-                self.window.write_event_value('-STATUS-', 
-                                            f'Iteration {iteration}/{MAX_ITERATIONS}')
+                # Wait for next interval (unless this is the last iteration),
+                # a stop request ends the wait straight away
+                if iteration < MAX_ITERATIONS:
+                    log.debug("[SAMPLER] Waiting %s seconds...", SAMPLE_INTERVAL)
+                    if await self.wait_for_stop(SAMPLE_INTERVAL):
+                        break
+        except Exception:
+            # Still let send_loop finish what is queued, a cancel from
+            # send_loop skips this because nothing reads the queue any more
+            await samples.put(None)
+            raise
+        
+        # None tells send_loop there are no more samples
+        await samples.put(None)
+    
+    async def wait_for_stop(self, timeout):
+        """
+        Wait up to timeout seconds for a stop request.
+        
+        Args:
+            timeout (float): Longest time to wait in seconds
+            
+        Returns:
+            bool: True if stop was requested, False if the time ran out
+        """
+        try:
+            await asyncio.wait_for(self.stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def send_loop(self):
+        """
+        Send queued samples to the server until the sampler runs out.
+        
+        Returns:
+            int: Last iteration number handled
+        """
+        # Made here so it belongs to this loop, then catch up on a stop
+        # that came in before the loop started
+        self.stop_event = asyncio.Event()
+        if self.stop_requested.is_set():
+            self.stop_event.set()
+        
+        samples = asyncio.Queue(maxsize=SAMPLE_QUEUE_SIZE)
+        sampler = asyncio.create_task(self.sample_loop(samples))
+        iteration = 0
+        
+        try:
+            while True:
+                # Wait for the sampler, None means it has finished or was stopped
+                json_data = await samples.get()
+                if json_data is None:
+                    # Send whatever is left of the last batch
+                    if self.batch_count:
+                        await self.send_batch(iteration)
+                    break
                 
-                # Collate data
-                json_data = collate_vcgen_data(iteration)
-                print(f"[ITERATION {iteration}] Data collected:")
-                print(f"  - Temperature: {json_data['core_temperature_c']}°C")
-                print(f"  - Voltage: {json_data['core_voltage_v']}V")
-                print(f"  - Frequency: {json_data['arm_frequency_mhz']} MHz")
-                print(f"  - GPU Memory: {json_data['gpu_memory_mb']} MB")
-                print(f"  - Status: {json_data['throttled_status']}")
+                iteration = json_data['iteration']
                 
-                # Convert to JSON string and bytes
-                json_string = json.dumps(json_data, indent=2)
-                json_bytes = json_string.encode('utf-8')
+                log.debug("[ITERATION %d/%d] Starting...", iteration, MAX_ITERATIONS)
                 
-                # Create socket and connect to server
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(5)
+                # Update status in GUI
+                self.window.write_event_value('-STATUS-', 
+                                            f'Iteration {iteration}/{MAX_ITERATIONS}')
                 
-                try:
-                    # Connect to server
-                    print(f"[ITERATION {iteration}] Connecting to server...")
-                    s.connect((self.server_ip, self.port))
-                    
-                    # Update LED to show connection
-                    self.window.write_event_value('-LED-', 'ON')
-                    print(f"[ITERATION {iteration}] ✓ Connected")
-                    
-                    # Send data
-                    print(f"[ITERATION {iteration}] Sending {len(json_bytes)} bytes...")
-                    s.send(json_bytes)
-                    print(f"[ITERATION {iteration}] ✓ Data sent successfully")
-                    
-                    # Close connection
-                    s.close()
-                    
-                    # Update LED to show disconnection
-                    time.sleep(0.1)  # Brief pause so LED toggle is visible
-                    self.window.write_event_value('-LED-', 'OFF')
-                    print(f"[ITERATION {iteration}] Connection closed\n")
-                    
-                    # Mark this iteration as successfully completed
-                    self.completed_iterations = iteration
-                    
-                except (ConnectionRefusedError, socket.timeout) as e:
-                    error_msg = f'Connection error: {str(e)}'
-                    print(f"[ITERATION {iteration}] ✗ {error_msg}\n")
-                    self.window.write_event_value('-ERROR-', error_msg)
-                    self.window.write_event_value('-LED-', 'OFF')
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[ITERATION %d] Data collected:\n"
+                              "  - Temperature: %s°C\n"
+                              "  - Voltage: %sV\n"
+                              "  - Frequency: %s MHz\n"
+                              "  - GPU Memory: %s MB\n"
+                              "  - Status: %s",
+                              iteration,
+                              json_data['core_temperature_c'],
+                              json_data['core_voltage_v'],
+                              json_data['arm_frequency_mhz'],
+                              json_data['gpu_memory_mb'],
+                              json_data['throttled_status'])
                 
-                # Wait for next interval (unless this is the last iteration)
-                if iteration < MAX_ITERATIONS and self.running:
-                    print(f"[ITERATION {iteration}] Waiting {SAMPLE_INTERVAL} seconds...")
-                    time.sleep(SAMPLE_INTERVAL)
+                # Convert to JSON bytes and frame them straight into the batch
+                # buffer, length header first
+                json_bytes = encode_sample(json_data)
+                start = self.batch_length + HEADER_SIZE
+                end = start + len(json_bytes)
+                HEADER.pack_into(self.batch_buffer, self.batch_length, len(json_bytes))
+                self.batch_buffer[start:end] = json_bytes
+                self.batch_length = end
+                self.batch_count += 1
                 
-            except Exception as e:
-                error_msg = f'Error in iteration {iteration}: {str(e)}'
-                print(f"[ITERATION {iteration}] ✗ EXCEPTION: {error_msg}\n")
-                self.window.write_event_value('-ERROR-', error_msg)
+                # Samples go out BATCH_SIZE at a time, one framed JSON object each
+                if self.batch_count >= BATCH_SIZE:
+                    await self.send_batch(iteration)
+            
+            # The sampler is done, awaiting it passes on an error it ended with
+            await sampler
         
-        # Send completion event with actual iterations completed
-        if self.running and iteration >= MAX_ITERATIONS:
-            # All iterations completed successfully
-            print(f"\n[CLIENT THREAD] ✓ Completed all {MAX_ITERATIONS} iterations")
-            self.window.write_event_value('-COMPLETE-', self.completed_iterations)
-        else:
-            # Stopped early by user
-            print(f"\n[CLIENT THREAD] Stopped after {self.completed_iterations} iterations")
-            self.window.write_event_value('-STOPPED-', self.completed_iterations)
+        finally:
+            sampler.cancel()
+            await self.close_connection()
+            print("[CLIENT THREAD] Connection closed")
+        
+        return iteration
+    
+    async def send_batch(self, iteration):
+        """
+        Send the samples in the batch buffer to the server in one write,
+        then empty the buffer for the next batch.
+        
+        Args:
+            iteration (int): Iteration number of the last sample in the batch
+        """
+        # The transport may hold on to what it is given, so it gets a copy
+        # and the buffer itself can be refilled straight away
+        data = bytes(memoryview(self.batch_buffer)[:self.batch_length])
+        count = self.batch_count
+        self.batch_length = 0
+        self.batch_count = 0
+        
+        try:
+            writer = await self.ensure_connected()
+            
+            log.debug("[ITERATION %d] Sending %d samples...", iteration, count)
+            writer.write(data)
+            await writer.drain()
+            log.debug("[ITERATION %d] ✓ Data sent successfully", iteration)
+            
+            # Flash the LED to show data went out, the GUI turns it off again
+            self.window.write_event_value('-LED-FLASH-', True)
+            
+            # Mark this iteration as successfully completed
+            self.completed_iterations = iteration
+            
+        except (OSError, asyncio.TimeoutError) as e:
+            error_msg = f'Connection error: {str(e)}'
+            log.warning("[ITERATION %d] ✗ %s", iteration, error_msg)
+            self.window.write_event_value('-ERROR-', error_msg)
+            # Drop the broken connection, the next batch reconnects
+            await self.close_connection()
+    
+    async def ensure_connected(self):
+        """
+        Open the connection to the server if there isn't one already.
+        All samples go over this one connection until an error closes it.
+        asyncio turns on TCP_NODELAY for its TCP connections.
+        
+        Returns:
+            asyncio.StreamWriter: Writer for the connection
+        """
+        if self.writer is None:
+            if self.sock is not None:
+                # Adopt the socket left open by the connection test
+                sock, self.sock = self.sock, None
+                reader, self.writer = await asyncio.open_connection(sock=sock)
+            else:
+                log.debug("[CLIENT THREAD] Connecting to %s:%d...", self.server_ip, self.port)
+                reader, self.writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.server_ip, self.port), timeout=5)
+            log.debug("[CLIENT THREAD] ✓ Connected")
+        return self.writer
+    
+    async def close_connection(self):
+        """Close the server connection if one is open."""
+        if self.writer is not None:
+            writer, self.writer = self.writer, None
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except OSError:
+                pass
     
     def stop(self):
-        """Stop the thread."""
+        """Stop the thread, safe to call from the GUI thread."""
         print("[CLIENT THREAD] Stop requested")
-        self.running = False
+        self.stop_requested.set()
+        if self.stop_event is None:
+            # send_loop has not started yet and will see stop_requested
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+        except RuntimeError:
+            # Loop already finished and closed
+            pass
 
 
 # ============================================================================
@@ -705,9 +1079,6 @@ def create_gui(server_ip, port):
     # Define theme
     sg.theme('DarkBlue3')
     
-    # Unicode LED symbols
-    LED_OFF = '⚫'  # Black circle
-    
     # Layout definition
     layout = [
         [sg.Text('RASPBERRY PI VCGENCMD CLIENT', font=('Helvetica', 16, 'bold'), 
@@ -751,6 +1122,81 @@ def create_gui(server_ip, port):
     return window
 
 
+# ============================================================================
+# THREAD EVENT HANDLERS
+# ============================================================================
+def handle_led_flash(window, values):
+    """Turn the LED on for a batch sent and let tkinter turn it off later."""
+    led = window['-LED-']
+    led.update(LED_ON)
+    window.TKroot.after(LED_FLASH_MS, led.update, LED_OFF)
+
+
+def handle_status(window, values):
+    """Show a status message sent by the client thread."""
+    window['-STATUS-'].update(values['-STATUS-'])
+
+
+def handle_error(window, values):
+    """Show an error message sent by the client thread."""
+    window['-ERROR-'].update(values['-ERROR-'])
+
+
+def handle_stopped(window, values):
+    """Reset the controls and report how far a session got when the user stopped it."""
+    iterations_completed = values['-STOPPED-']
+    print(f"\n[MAIN] Stopped after {iterations_completed} iterations")
+    window['-STATUS-'].update(f'Stopped at {iterations_completed}/{MAX_ITERATIONS} iterations')
+    window['-START-'].update(disabled=False)
+    window['-STOP-'].update(disabled=True)
+    
+    # Show accurate stopped message, without waiting for it to be closed
+    # so events keep being handled while it is up
+    if iterations_completed > 0:
+        sg.popup_no_wait('Stopped', 
+                         f'Session stopped by user.\n'
+                         f'Completed {iterations_completed} of {MAX_ITERATIONS} data samples.',
+                         title='Client Stopped')
+    else:
+        sg.popup_no_wait('Stopped', 
+                         'Session stopped before any data was sent.',
+                         title='Client Stopped')
+    print(f"[MAIN] Stop notification shown ({iterations_completed} iterations)\n")
+
+
+def handle_failed(window, values):
+    """Reset the controls after a session ended by an error, the error is already shown."""
+    iterations_completed = values['-FAILED-']
+    print(f"\n[MAIN] Session failed after {iterations_completed} iterations")
+    window['-STATUS-'].update(f'Failed at {iterations_completed}/{MAX_ITERATIONS} iterations')
+    window['-START-'].update(disabled=False)
+    window['-STOP-'].update(disabled=True)
+
+
+def handle_complete(window, values):
+    """Reset the controls and report a session that sent every iteration."""
+    iterations_completed = values['-COMPLETE-']
+    print(f"\n[MAIN] All {MAX_ITERATIONS} iterations completed successfully!")
+    window['-STATUS-'].update(f'Completed {MAX_ITERATIONS} iterations!')
+    window['-START-'].update(disabled=False)
+    window['-STOP-'].update(disabled=True)
+    sg.popup_no_wait('Complete', 
+                     f'Successfully sent all {iterations_completed} data samples to server.',
+                     title='Client Complete')
+    print("[MAIN] Completion popup shown\n")
+
+
+# Event key -> handler for the events the client thread sends
+THREAD_EVENT_HANDLERS = {
+    '-LED-FLASH-': handle_led_flash,
+    '-STATUS-': handle_status,
+    '-ERROR-': handle_error,
+    '-STOPPED-': handle_stopped,
+    '-FAILED-': handle_failed,
+    '-COMPLETE-': handle_complete,
+}
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
@@ -779,7 +1225,8 @@ def main():
         sys.exit(0)
     
     # Establish connection with interactive workflow
-    connection_success, server_ip = establish_connection(DEFAULT_SERVER_IP, DEFAULT_PORT)
+    connection_success, server_ip, server_socket = establish_connection(DEFAULT_SERVER_IP,
+                                                                        DEFAULT_PORT)
     
     if not connection_success:
         print("\n[EXIT] Connection establishment cancelled or failed")
@@ -805,16 +1252,13 @@ def main():
     except:
         pass
     
-    # Unicode LED symbols
-    LED_OFF = '⚫'
-    LED_ON = '🟢'
-    
     try:
         print("[MAIN] Entering event loop\n")
         
         # Event loop
         while True:
-            event, values = window.read(timeout=100)
+            # Thread events wake read() straight away, the timeout only bounds idle wakeups
+            event, values = window.read(timeout=1000)
             
             # Handle window close
             if event in (sg.WIN_CLOSED, sg.WIN_CLOSE_ATTEMPTED_EVENT, '-EXIT-'):
@@ -839,7 +1283,8 @@ def main():
                     window.refresh()
                     
                     # Start client thread
-                    client_thread = ClientThread(server_ip, DEFAULT_PORT, window)
+                    client_thread = ClientThread(server_ip, DEFAULT_PORT, window, server_socket)
+                    server_socket = None  # Now owned by the client thread
                     client_thread.start()
                     print("[MAIN] Client thread started\n")
             
@@ -873,7 +1318,8 @@ def main():
                         # User provided an IP, test connection
                         current_ip = new_ip  # Update for next retry if needed
                         print(f"[MAIN] Testing connection to {new_ip}:{DEFAULT_PORT}")
-                        success, message = test_server_connection(new_ip, DEFAULT_PORT)
+                        success, message, server_socket = open_server_connection(new_ip,
+                                                                                 DEFAULT_PORT)
                         
                         if success:
                             # Connection successful - update server IP and recreate GUI
@@ -915,69 +1361,10 @@ def main():
                                 continue
 
             
-            # Handle LED toggle events from thread
-            if event == '-LED-':
-                led_state = values['-LED-']
-                if led_state == 'ON':
-                    window['-LED-'].update(LED_ON)
-                else:
-                    window['-LED-'].update(LED_OFF)
-            
-            # Handle status updates from thread
-            if event == '-STATUS-':
-                status_text = values['-STATUS-']
-                window['-STATUS-'].update(status_text)
-            
-            # Handle error messages from thread
-            if event == '-ERROR-':
-                error_text = values['-ERROR-']
-                window['-ERROR-'].update(error_text)
-            
-            # Handle early stop by user
-            if event == '-STOPPED-':
-                iterations_completed = values['-STOPPED-']
-                print(f"\n[MAIN] Stopped after {iterations_completed} iterations")
-                window['-STATUS-'].update(f'Stopped at {iterations_completed}/{MAX_ITERATIONS} iterations')
-                window['-START-'].update(disabled=False)
-                window['-STOP-'].update(disabled=True)
-                
-                # Show accurate stopped message
-                if iterations_completed > 0:
-                    sg.popup('Stopped', 
-                            f'Session stopped by user.\n'
-                            f'Completed {iterations_completed} of {MAX_ITERATIONS} data samples.',
-                            title='Client Stopped')
-                else:
-                    sg.popup('Stopped', 
-                            'Session stopped before any data was sent.',
-                            title='Client Stopped')
-                print(f"[MAIN] Stop notification shown ({iterations_completed} iterations)\n")
-                
-                # Restore focus after stopped dialog
-                try:
-                    window.bring_to_front()
-                    window.force_focus()
-                except:
-                    pass
-            
-            # Handle completion
-            if event == '-COMPLETE-':
-                iterations_completed = values['-COMPLETE-']
-                print(f"\n[MAIN] All {MAX_ITERATIONS} iterations completed successfully!")
-                window['-STATUS-'].update(f'Completed {MAX_ITERATIONS} iterations!')
-                window['-START-'].update(disabled=False)
-                window['-STOP-'].update(disabled=True)
-                sg.popup('Complete', 
-                        f'Successfully sent all {iterations_completed} data samples to server.',
-                        title='Client Complete')
-                print("[MAIN] Completion popup shown\n")
-                
-                # FIX 6: Restore focus after completion dialog
-                try:
-                    window.bring_to_front()
-                    window.force_focus()
-                except:
-                    pass
+            # Handle LED, status, error, stop and completion events from thread
+            handler = THREAD_EVENT_HANDLERS.get(event)
+            if handler:
+                handler(window, values)
     
     except KeyboardInterrupt:
         print("\n[MAIN] Client interrupted by user (Ctrl+C)")
@@ -994,6 +1381,12 @@ def main():
             client_thread.stop()
             client_thread.join(timeout=1)
         
+        # Close the connection if Start was never pressed
+        if server_socket is not None:
+            server_socket.close()
+        
+        close_dialogs()
+        
         try:
             window.close()
             print("[MAIN] Window closed")
@@ -21,6 +21,8 @@ Requirements:
 
 import socket
 import json
+import selectors
+import struct
 import sys
 import threading
 import time
@@ -30,6 +32,13 @@ except ImportError:
     print("Error: FreeSimpleGUI module not found. Please install it first.")
     sys.exit(1)
 
+# orjson is a faster C JSON parser that reads bytes directly, use it if installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 # ============================================================================
 # CONFIGURATION
@@ -37,6 +46,14 @@ except ImportError:
 SERVER_HOST = ''  # Listen on all interfaces
 SERVER_PORT = 5000
 
+# Every message starts with its length as a 4 byte big endian header
+HEADER = struct.Struct('>I')
+HEADER_SIZE = HEADER.size
+
+# Largest message accepted, a sample is about 190 bytes so anything near
+# this is a corrupt header and the client is dropped instead of buffered
+MAX_MESSAGE_SIZE = 64 * 1024
+
 
 # ============================================================================
 # SERVER THREAD
@@ -58,20 +75,29 @@ class ServerThread(threading.Thread):
         self.running = True
         self.daemon = True
         self.socket = None
+        self.selector = selectors.DefaultSelector()
+        self.buffers = {}  # Partial message bytes for each connected client
     
     def run(self):
         """
-        Main thread execution - listens for client connections and receives data.
+        Main thread execution - waits on the listening socket and every client
+        at once, accepting connections and receiving data as it arrives.
         """
         try:
             # Create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.settimeout(1.0)  # Timeout to allow checking running flag
+            # SO_REUSEPORT does not exist on Windows
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.socket.setblocking(False)
             
             # Bind and listen
             self.socket.bind((SERVER_HOST, SERVER_PORT))
-            self.socket.listen(5)
+            self.socket.listen(128)
+            
+            # Each registered socket carries the method that handles it
+            self.selector.register(self.socket, selectors.EVENT_READ, self.accept_client)
             
             # Get server IP
             server_ip = self.get_server_ip()
@@ -79,59 +105,128 @@ class ServerThread(threading.Thread):
             self.window.write_event_value('-STATUS-', 'Waiting for connection...')
             
             while self.running:
-                try:
-                    # Accept client connection (with timeout)
-                    client_socket, addr = self.socket.accept()
-                    
-                    # Update status
-                    self.window.write_event_value('-STATUS-', 
-                                                 f'Connected to {addr[0]}:{addr[1]}')
-                    
-                    # Receive data
-                    data_received = client_socket.recv(4096)
-                    
-                    if data_received:
-                        try:
-                            # Decode and parse JSON
-                            json_string = data_received.decode('utf-8')
-                            data = json.loads(json_string)
-                            
-                            # Send data to GUI
-                            self.window.write_event_value('-DATA-', data)
-                            
-                            # Toggle LED
-                            self.window.write_event_value('-LED_TOGGLE-', True)
-                            
-                        except json.JSONDecodeError as e:
-                            self.window.write_event_value('-ERROR-', 
-                                                         f'JSON parse error: {e}')
-                        except Exception as e:
+                # Short timeout so the running flag is still checked when idle
+                for key, _ in self.selector.select(timeout=0.1):
+                    try:
+                        key.data(key.fileobj)
+                    except Exception as e:
+                        if self.running:  # Only report error if still running
                             self.window.write_event_value('-ERROR-', 
-                                                         f'Data processing error: {e}')
-                    
-                    # Close client connection
-                    client_socket.close()
-                    
-                except socket.timeout:
-                    # Timeout is normal, just continue to check running flag
-                    continue
-                    
-                except Exception as e:
-                    if self.running:  # Only report error if still running
-                        self.window.write_event_value('-ERROR-', 
-                                                     f'Connection error: {e}')
+                                                         f'Connection error: {e}')
+                        if key.fileobj is not self.socket:
+                            self.close_client(key.fileobj)
         
         except Exception as e:
             self.window.write_event_value('-ERROR-', f'Server error: {e}')
         
         finally:
-            # Clean up socket
+            # Clean up client and listening sockets
+            for client_socket in list(self.buffers):
+                self.close_client(client_socket)
+            self.selector.close()
             if self.socket:
                 try:
                     self.socket.close()
                 except:
                     pass
     
+    def accept_client(self, server_socket):
+        """
+        Accept a new client connection and start watching it for data.
+        
+        Args:
+            server_socket (socket.socket): Listening socket
+        """
+        client_socket, addr = server_socket.accept()
+        client_socket.setblocking(False)
+        # Small messages go out straight away instead of waiting on Nagle
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.buffers[client_socket] = bytearray()
+        self.selector.register(client_socket, selectors.EVENT_READ, self.read_client)
+        
+        # Update status
+        self.window.write_event_value('-STATUS-', 
+                                     f'Connected to {addr[0]}:{addr[1]}')
+    
+    def read_client(self, client_socket):
+        """
+        Receive whatever a client has sent and handle each complete
+        length prefixed JSON message.
+        
+        Args:
+            client_socket (socket.socket): Connected client socket
+        """
+        try:
+            chunk = client_socket.recv(4096)
+        except BlockingIOError:
+            # Woken up with nothing to read yet, wait for the next event
+            return
+        except ConnectionResetError:
+            self.close_client(client_socket)
+            return
+        
+        if not chunk:
+            self.close_client(client_socket)
+            return
+        
+        # Handle every complete message, keep any partial one for the next recv
+        buffer = self.buffers[client_socket]
+        buffer += chunk
+        start = 0
+        while len(buffer) - start >= HEADER_SIZE:
+            (length,) = HEADER.unpack_from(buffer, start)
+            if length > MAX_MESSAGE_SIZE:
+                self.window.write_event_value('-ERROR-', 
+                                             f'Message of {length} bytes is too large, closing connection')
+                self.close_client(client_socket)
+                return
+            end = start + HEADER_SIZE + length
+            if len(buffer) < end:
+                break
+            self.handle_message(bytes(buffer[start + HEADER_SIZE:end]))
+            start = end
+        del buffer[:start]
+    
+    def close_client(self, client_socket):
+        """
+        Stop watching a client and close its connection.
+        
+        Args:
+            client_socket (socket.socket): Connected client socket
+        """
+        self.buffers.pop(client_socket, None)
+        try:
+            self.selector.unregister(client_socket)
+        except (KeyError, ValueError):
+            pass
+        client_socket.close()
+        if not self.buffers:
+            self.window.write_event_value('-STATUS-', 'Waiting for connection...')
+    
+    def handle_message(self, data_received):
+        """
+        Parse one JSON message and send it to the GUI.
+        
+        Args:
+            data_received (bytes): One JSON object
+        """
+        try:
+            # Parse JSON straight from the received bytes
+            data = json_loads(data_received)
+            
+            # Send data to GUI
+            self.window.write_event_value('-DATA-', data)
+            
+            # Toggle LED
+            self.window.write_event_value('-LED_TOGGLE-', True)
+            
+        except json.JSONDecodeError as e:
+            self.window.write_event_value('-ERROR-', 
+                                         f'JSON parse error: {e}')
+        except Exception as e:
+            self.window.write_event_value('-ERROR-', 
+                                         f'Data processing error: {e}')
+    
     def stop(self):
         """Stop the server thread."""
         self.running = False
@@ -223,48 +318,47 @@ def create_gui():
 # ============================================================================
 # DATA DISPLAY FUNCTION
 # ============================================================================
-def update_data_display(window, data):
+# Each received field with the element that shows it and how it is formatted
+FIELD_MAP = (
+    ('iteration', '-ITERATION-', '{}'),
+    ('core_temperature_c', '-TEMP-', '{}°C'),
+    ('core_voltage_v', '-VOLTAGE-', '{}V'),
+    ('arm_frequency_mhz', '-FREQ-', '{} MHz'),
+    ('gpu_memory_mb', '-GPU-', '{} MB'),
+    ('throttled_status', '-THROTTLE-', '{}'),
+    ('timestamp', '-TIMESTAMP-', '{}'),
+)
+
+
+def get_display_fields(window):
+    """
+    Look up the data display elements once so each update skips the window's
+    key lookup.
+    
+    Args:
+        window: FreeSimpleGUI window instance
+        
+    Returns:
+        tuple: (json key, element, format string) for each entry in FIELD_MAP
+    """
+    return tuple((json_key, window[widget_key], fmt)
+                 for json_key, widget_key, fmt in FIELD_MAP)
+
+
+def update_data_display(window, fields, data):
     """
     Update the GUI with received data.
     
     Args:
         window: FreeSimpleGUI window instance
+        fields (tuple): Display fields from get_display_fields
         data (dict): Dictionary containing sensor data
     """
     try:
-        # Update iteration count
-        if 'iteration' in data:
-            window['-ITERATION-'].update(f"{data['iteration']}")
-        
-        # Update temperature
-        if 'core_temperature_c' in data:
-            temp = data['core_temperature_c']
-            window['-TEMP-'].update(f"{temp}°C")
-        
-        # Update voltage
-        if 'core_voltage_v' in data:
-            voltage = data['core_voltage_v']
-            window['-VOLTAGE-'].update(f"{voltage}V")
-        
-        # Update frequency
-        if 'arm_frequency_mhz' in data:
-            freq = data['arm_frequency_mhz']
-            window['-FREQ-'].update(f"{freq} MHz")
-        
-        # Update GPU memory
-        if 'gpu_memory_mb' in data:
-            gpu_mem = data['gpu_memory_mb']
-            window['-GPU-'].update(f"{gpu_mem} MB")
-        
-        # Update throttled status
-        if 'throttled_status' in data:
-            throttle = data['throttled_status']
-            window['-THROTTLE-'].update(throttle)
-        
-        # Update timestamp
-        if 'timestamp' in data:
-            timestamp = data['timestamp']
-            window['-TIMESTAMP-'].update(timestamp)
+        for json_key, element, fmt in fields:
+            value = data.get(json_key)
+            if value is not None:
+                element.update(fmt.format(value))
             
     except Exception as e:
         window['-ERROR-'].update(f"Display error: {e}")
@@ -287,6 +381,7 @@ def main():
     
     # Create GUI
     window = create_gui()
+    display_fields = get_display_fields(window)
     
     # Start server thread
     server_thread = ServerThread(window)
@@ -300,30 +395,27 @@ def main():
     try:
         # Event loop
         while True:
-            event, values = window.read(timeout=100)
+            # Server thread events wake read() straight away, the timeout only bounds idle wakeups
+            event, values = window.read(timeout=1000)
             
             # Handle window close
             if event in (sg.WIN_CLOSED, sg.WIN_CLOSE_ATTEMPTED_EVENT, '-EXIT-'):
                 break
             
-            # Handle server IP update
-            if event == '-SERVER_IP-':
-                server_ip = values['-SERVER_IP-']
-                window['-SERVER_IP-'].update(server_ip)
-                print(f"Server listening on: {server_ip}:{SERVER_PORT}")
+            # Timeouts carry nothing to show
+            if event == sg.TIMEOUT_EVENT:
+                continue
             
-            # Handle status updates
-            if event == '-STATUS-':
-                status_text = values['-STATUS-']
-                window['-STATUS-'].update(status_text)
+            # Server thread events arrive through write_event_value, each one
+            # with its payload stored under its own key
+            payload = values.get(event)
             
-            # Handle data received
+            # Handle data received, the most frequent event so it is checked first
             if event == '-DATA-':
-                data = values['-DATA-']
-                update_data_display(window, data)
+                update_data_display(window, display_fields, payload)
             
             # Handle LED toggle
-            if event == '-LED_TOGGLE-':
+            elif event == '-LED_TOGGLE-':
                 # Toggle LED state
                 led_state = not led_state
                 if led_state:
@@ -331,11 +423,19 @@ def main():
                 else:
                     window['-LED-'].update(LED_OFF)
             
+            # Handle status updates
+            elif event == '-STATUS-':
+                window['-STATUS-'].update(payload)
+            
             # Handle error messages
-            if event == '-ERROR-':
-                error_text = values['-ERROR-']
-                window['-ERROR-'].update(error_text)
-                print(f"Error: {error_text}")
+            elif event == '-ERROR-':
+                window['-ERROR-'].update(payload)
+                print(f"Error: {payload}")
+            
+            # Handle server IP update
+            elif event == '-SERVER_IP-':
+                window['-SERVER_IP-'].update(payload)
+                print(f"Server listening on: {payload}:{SERVER_PORT}")
     
     except KeyboardInterrupt:
         print("\nServer interrupted by user")
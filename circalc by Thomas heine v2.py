@@ -28,7 +28,6 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 """
 
 import math
-from decimal import Decimal, ROUND_DOWN
 
 
 def getComp(unitNam):
@@ -46,18 +45,20 @@ def resFrq(indH, capF):
     return 1 / (2 * math.pi * math.sqrt(indH * capF))
 
 
-def qFact(indH, resOhm, capF):
-    return (1 / resOhm) * math.sqrt(indH / capF)
-
-
-def band(resHz, qFac):
-    return resHz / qFac
+def band(indH, resOhm):
+    """bandwidth = f / Q simplifies to R / (2 pi L) so it needs no square root."""
+    return resOhm / (2 * math.pi * indH)
 
 
 def cnvUnt(val, expn):
     """convert metric-prefixed units to base units using powers of 10."""
     return val * 10 ** expn
 
+
+def trunc2(val):
+    """truncate a result to two decimal places for display."""
+    return math.floor(val * 100) / 100
+
 """-------"""
 
 
@@ -77,21 +78,21 @@ while True:
     capF = cnvUnt(capUf, -6)
 
     resHz = resFrq(indH, capF)
-    qFac = qFact(indH, resOhm, capF)
-    bandHz = band(resHz, qFac)
+    bandHz = band(indH, resOhm)
+    qFac = resHz / bandHz
 
-    # Round results to two decimal places
-    resHz = Decimal(resHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-    qFac = Decimal(qFac).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-    bandHz = Decimal(bandHz).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+    # Round results down to two decimal places
+    resHz = trunc2(resHz)
+    qFac = trunc2(qFac)
+    bandHz = trunc2(bandHz)
 
     # Calculate the resonant frequency and the Q factor of this circuit
     # Formulas TBD
     
     print(f"Comp vals: L = {indMh} mH, C = {capUf} uF, R = {resOhm} Ω\n")
 
-    print(f"Resonant freq: {resHz} Hz\n")
-    print(f"Q factor: {qFac}\n")
-    print(f"Bandwidth: {bandHz} Hz\n")
+    print(f"Resonant freq: {resHz:.2f} Hz\n")
+    print(f"Q factor: {qFac:.2f}\n")
+    print(f"Bandwidth: {bandHz:.2f} Hz\n")
     
 """-------"""
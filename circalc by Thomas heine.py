@@ -28,7 +28,6 @@ to your assignment1 repository on the server hg.set.durhamcollege.org.
 """
 
 import math
-from decimal import Decimal, ROUND_DOWN
 
 def getLemon(name):
     x = float(input("What is the inductance in "+name+"? "))
@@ -41,17 +40,18 @@ def calcRF(l,c):
     rf = 1 / (2 * math.pi * math.sqrt(l * c))
     return rf
 
-def calcQ(l,r,c):
-    q = (1 / r) * math.sqrt(l / c)    
-    return q
-
-def calcBW(rf,q):
-    bw = rf/q
+# bw = rf/q works out to r/(2 pi l), no square root needed
+def calcBW(l,r):
+    bw = r/(2 * math.pi * l)
     return bw
 
 def convertMag(x,mod):
     y = x*10**(mod)
     return y
+
+def trunc2(x):
+    y = math.floor(x*100)/100
+    return y
     
 
 print("Series resonant circuit calculator\n(CTRL-C to quit)")
@@ -66,18 +66,18 @@ while True:
     cB = convertMag(cA,-6)
     
     rf = calcRF(lB,cB)
-    q = calcQ(lB,rA,cB)
-    bw = calcBW(rf,q)
+    bw = calcBW(lB,rA)
+    q = rf/bw
     
-    rf = Decimal(rf).quantize(Decimal('0.00'), rounding=ROUND_DOWN) 
-    q = Decimal(q).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
-    bw = Decimal(bw).quantize(Decimal('0.00'), rounding=ROUND_DOWN)
+    rf = trunc2(rf)
+    q = trunc2(q)
+    bw = trunc2(bw)
 
     # Calculate the resonant frequency and the Q factor of this circuit
     # Formulas TBD
     print("lcr: ", lA, cA, rA, "\n")
     
-    print("resonant frequency: "+str(rf)+" Hz\n")
-    print("Q factor: "+str(q)+"\n")
-    print("bandwidth: "+str(bw)+" Hz\n")
+    print("resonant frequency: "+format(rf, ".2f")+" Hz\n")
+    print("Q factor: "+format(q, ".2f")+"\n")
+    print("bandwidth: "+format(bw, ".2f")+" Hz\n")
     
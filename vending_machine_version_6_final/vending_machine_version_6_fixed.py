@@ -23,23 +23,47 @@ BUTTON_PIN = 22
 
 import sys
 import os
-from time import sleep
-import platform
+import queue
+import socket
+import subprocess
+import threading
+from contextlib import suppress
+from functools import partial
+from time import sleep, monotonic
+from types import MappingProxyType, MethodType
+
+# os.uname is one cheap system call, the platform module is only needed
+# where it does not exist (Windows)
+if hasattr(os, 'uname'):
+    uname = os.uname()
+    SYSTEM, RELEASE, MACHINE = uname.sysname, uname.release, uname.machine
+else:
+    import platform
+    SYSTEM, RELEASE, MACHINE = platform.system(), platform.release(), platform.machine()
+
+# Enable comprehensive debugging, running with python -O turns it off
+DEBUG = __debug__
+METHOD_TRACE = __debug__
 
-# Enable comprehensive debugging
-DEBUG = True
-METHOD_TRACE = True
+def no_op(*args, **kwargs):
+    """Stands in for a debug function that is turned off"""
 
-def debug_print(msg, level="INFO"):
-    """Enhanced debug printing with levels"""
-    if DEBUG:
-        print(f"[{level}] {msg}")
+def debug_print(msg, *args, level="INFO"):
+    """Enhanced debug printing with levels, args are only %-formatted into msg when printing"""
+    if args:
+        msg = msg % args
+    print(f"[{level}] {msg}")
 
 def method_confirm(method_name, status, details=""):
     """Track method usage from FreeSimpleGUI"""
-    if METHOD_TRACE:
-        symbol = "[OK]" if status == "SUCCESS" else "[FAIL]"
-        print(f"  {symbol} Method: {method_name} - {status} {details}")
+    symbol = "[OK]" if status == "SUCCESS" else "[FAIL]"
+    print(f"  {symbol} Method: {method_name} - {status} {details}")
+
+# Turned off functions are swapped out once here instead of checking the flag every call
+if not DEBUG:
+    debug_print = no_op
+if not METHOD_TRACE:
+    method_confirm = no_op
 
 # ============================================================================
 # FREESIMPLEGUI IMPORT WITH AUTOMATIC FIX FOR DC CONNECT VERSION
@@ -50,118 +74,128 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-debug_print(f"Running from: {current_dir}")
-debug_print(f"Python version: {sys.version}")
-debug_print(f"Platform: {platform.system()} {platform.release()}")
+debug_print("Running from: %s", current_dir)
+debug_print("Python version: %s", sys.version)
+debug_print("Platform: %s %s", SYSTEM, RELEASE)
 
 # Check for FreeSimpleGUI.py
 freesimplegui_path = os.path.join(current_dir, "FreeSimpleGUI.py")
-debug_print(f"Looking for FreeSimpleGUI.py in: {current_dir}")
+debug_print("Looking for FreeSimpleGUI.py in: %s", current_dir)
 
 if os.path.exists(freesimplegui_path):
-    debug_print(f"Found FreeSimpleGUI.py at: {freesimplegui_path}", "SUCCESS")
-    
-    # READ AND FIX THE FILE BEFORE IMPORTING
-    debug_print("Attempting to auto-fix FreeSimpleGUI.py syntax error...")
-    
-    try:
-        # Read the original file
-        with open(freesimplegui_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+    debug_print("Found FreeSimpleGUI.py at: %s", freesimplegui_path, level="SUCCESS")
+    
+    # A fixed copy left by an earlier run is reused as long as it is newer
+    # than FreeSimpleGUI.py, so the file is only read and fixed once
+    fixed_path = os.path.join(current_dir, "FreeSimpleGUI_temp_fixed.py")
+    if (os.path.exists(fixed_path)
+            and os.path.getmtime(fixed_path) >= os.path.getmtime(freesimplegui_path)):
+        debug_print("Using existing fixed version: %s", fixed_path, level="SUCCESS")
+        import FreeSimpleGUI_temp_fixed as sg
+        sys.modules['FreeSimpleGUI'] = sg
+    else:
+        # READ AND FIX THE FILE BEFORE IMPORTING
+        debug_print("Attempting to auto-fix FreeSimpleGUI.py syntax error...")
         
-        # Check line 19 (index 18)
-        if len(lines) > 18:
-            line_19 = lines[18]
-            debug_print(f"Line 19 content: {line_19.strip()}")
+        try:
+            # Read the original file
+            with open(freesimplegui_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
             
-            if "import random=" in line_19:
-                debug_print("Found syntax error 'import random=' on line 19", "WARNING")
-                
-                # Create a temporary fixed version
-                fixed_path = os.path.join(current_dir, "FreeSimpleGUI_temp_fixed.py")
-                debug_print(f"Creating temporary fixed version: {fixed_path}")
-                
-                # Fix the line
-                lines[18] = "import random\n"
-                
-                # Write the fixed version
-                with open(fixed_path, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-                
-                debug_print("Temporary fixed file created successfully", "SUCCESS")
-                
-                # Import from the fixed file
-                sys.path.insert(0, current_dir)
-                import FreeSimpleGUI_temp_fixed as sg
-                debug_print("FreeSimpleGUI imported from fixed version", "SUCCESS")
-                
-                # Clean up the import name
-                sys.modules['FreeSimpleGUI'] = sg
+            # Check line 19 (index 18)
+            if len(lines) > 18:
+                line_19 = lines[18]
+                debug_print("Line 19 content: %s", line_19.strip())
                 
+                if "import random=" in line_19:
+                    debug_print("Found syntax error 'import random=' on line 19", level="WARNING")
+                    
+                    # Create a temporary fixed version
+                    debug_print("Creating temporary fixed version: %s", fixed_path)
+                    
+                    # Fix the line
+                    lines[18] = "import random\n"
+                    
+                    # Write the fixed version
+                    with open(fixed_path, 'w', encoding='utf-8') as f:
+                        f.writelines(lines)
+                    
+                    debug_print("Temporary fixed file created successfully", level="SUCCESS")
+                    
+                    # Import from the fixed file
+                    import FreeSimpleGUI_temp_fixed as sg
+                    debug_print("FreeSimpleGUI imported from fixed version", level="SUCCESS")
+                    
+                    # Clean up the import name
+                    sys.modules['FreeSimpleGUI'] = sg
+                    
+                else:
+                    debug_print("Line 19 appears to be correct, importing directly")
+                    import FreeSimpleGUI as sg
+                    debug_print("FreeSimpleGUI imported successfully", level="SUCCESS")
             else:
-                debug_print("Line 19 appears to be correct, importing directly")
-                import FreeSimpleGUI as sg
-                debug_print("FreeSimpleGUI imported successfully", "SUCCESS")
-        else:
-            debug_print("File has less than 19 lines - unexpected!", "ERROR")
-            sys.exit(1)
+                debug_print("File has less than 19 lines - unexpected!", level="ERROR")
+                sys.exit(1)
             
-    except Exception as e:
-        debug_print(f"Failed to read/fix FreeSimpleGUI.py: {e}", "ERROR")
-        sys.exit(1)
+        except Exception as e:
+            debug_print("Failed to read/fix FreeSimpleGUI.py: %s", e, level="ERROR")
+            sys.exit(1)
 else:
-    debug_print(f"FreeSimpleGUI.py NOT FOUND at: {freesimplegui_path}", "ERROR")
+    debug_print("FreeSimpleGUI.py NOT FOUND at: %s", freesimplegui_path, level="ERROR")
     sys.exit(1)
 
 # ============================================================================
 # VERIFY FREESIMPLEGUI IMPORT AND TEST METHODS
 # ============================================================================
 
-debug_print("\n=== Testing FreeSimpleGUI Methods ===")
-
-# Test basic attributes
-try:
-    version = sg.version if hasattr(sg, 'version') else "Unknown"
-    method_confirm("sg.version", "SUCCESS", f"Version: {version}")
-except Exception as e:
-    method_confirm("sg.version", "FAILED", str(e))
-
-# Test theme method
-try:
-    sg.theme('BluePurple')
-    method_confirm("sg.theme()", "SUCCESS", "Theme set to BluePurple")
-except Exception as e:
-    method_confirm("sg.theme()", "FAILED", str(e))
-
-# Test Text element
-try:
-    test_text = sg.Text("Test")
-    method_confirm("sg.Text()", "SUCCESS", "Text element created")
-except Exception as e:
-    method_confirm("sg.Text()", "FAILED", str(e))
-
-# Test Button element
-try:
-    test_button = sg.Button("Test")
-    method_confirm("sg.Button()", "SUCCESS", "Button element created")
-except Exception as e:
-    method_confirm("sg.Button()", "FAILED", str(e))
-
-# Test Column element
-try:
-    test_column = sg.Column([[]])
-    method_confirm("sg.Column()", "SUCCESS", "Column element created")
-except Exception as e:
-    method_confirm("sg.Column()", "FAILED", str(e))
-
-# Test Window class
-try:
-    test_window = sg.Window
-    method_confirm("sg.Window", "SUCCESS", "Window class available")
-except Exception as e:
-    method_confirm("sg.Window", "FAILED", str(e))
-
-debug_print("=== FreeSimpleGUI Testing Complete ===\n")
+# Building test widgets is slow, so the method checks only run when asked for
+# with the VMACH_SMOKE environment variable. The theme is set again in main.
+if DEBUG and os.environ.get("VMACH_SMOKE"):
+    debug_print("\n=== Testing FreeSimpleGUI Methods ===")
+
+    # Test basic attributes
+    try:
+        version = sg.version if hasattr(sg, 'version') else "Unknown"
+        method_confirm("sg.version", "SUCCESS", f"Version: {version}")
+    except Exception as e:
+        method_confirm("sg.version", "FAILED", str(e))
+
+    # Test theme method
+    try:
+        sg.theme('BluePurple')
+        method_confirm("sg.theme()", "SUCCESS", "Theme set to BluePurple")
+    except Exception as e:
+        method_confirm("sg.theme()", "FAILED", str(e))
+
+    # Test Text element
+    try:
+        test_text = sg.Text("Test")
+        method_confirm("sg.Text()", "SUCCESS", "Text element created")
+    except Exception as e:
+        method_confirm("sg.Text()", "FAILED", str(e))
+
+    # Test Button element
+    try:
+        test_button = sg.Button("Test")
+        method_confirm("sg.Button()", "SUCCESS", "Button element created")
+    except Exception as e:
+        method_confirm("sg.Button()", "FAILED", str(e))
+
+    # Test Column element
+    try:
+        test_column = sg.Column([[]])
+        method_confirm("sg.Column()", "SUCCESS", "Column element created")
+    except Exception as e:
+        method_confirm("sg.Column()", "FAILED", str(e))
+
+    # Test Window class
+    try:
+        test_window = sg.Window
+        method_confirm("sg.Window", "SUCCESS", "Window class available")
+    except Exception as e:
+        method_confirm("sg.Window", "FAILED", str(e))
+
+    debug_print("=== FreeSimpleGUI Testing Complete ===\n")
 
 # ============================================================================
 # GPIO PIN CONFIGURATION (Raspberry Pi only)
@@ -172,24 +206,54 @@ SERVO_PIN = 17          # GPIO pin for servo motor (product dispenser)
 LED_PIN = 27            # GPIO pin for LED (change indicator)
 BUTTON_PIN = 22         # GPIO pin for physical coin return button
 
+# Change LED blink timing, each on or off step lasts this long
+BLINK_MS = 200
+
+# Longest the main loop waits for a GUI event when nothing is blinking,
+# button presses (GUI and GPIO) wake it straight away
+POLL_MS = 500
+
+# Presses of the return button closer together than this are contact bounce
+# and are dropped by gpiozero, so one press only posts one event
+BOUNCE_S = 0.1
+
+# Port the pigpio daemon listens on
+PIGPIOD_PORT = 8888
+
+# Change LED symbols shown in the GUI
+CIRCLE = '⚫'  # ASCII for LED on
+CIRCLE_OUTLINE = '⚪'  # ASCII for LED off
+
+# GUI fonts, shared by every element that uses them
+FONT_HEADER = ("Helvetica", 24)
+FONT_COIN = ("Helvetica", 18)
+FONT_DISPLAY = ("Helvetica", 16)
+FONT_PRODUCT = ("Helvetica", 14)
+FONT_SMALL = ("Helvetica", 12)
+
 # ============================================================================
 # PLATFORM DETECTION
 # ============================================================================
 
 def detect_platform():
     """Detect if running on Raspberry Pi"""
-    system = platform.system()
-    machine = platform.machine()
-    
-    is_pi = (system == "Linux" and ("arm" in machine or "aarch64" in machine))
+    is_pi = (SYSTEM == "Linux" and ("arm" in MACHINE or "aarch64" in MACHINE))
     
     if is_pi:
-        debug_print("Detected: Raspberry Pi", "INFO")
+        debug_print("Detected: Raspberry Pi")
     else:
-        debug_print(f"Detected: {system} on {machine} (GPIO disabled)", "INFO")
+        debug_print("Detected: %s on %s (GPIO disabled)", SYSTEM, MACHINE)
     
     return is_pi
 
+def pigpiod_running():
+    """Check if the pigpio daemon is already listening on its default port"""
+    try:
+        socket.create_connection(("127.0.0.1", PIGPIOD_PORT), 0.05).close()
+        return True
+    except OSError:
+        return False
+
 # Determine platform and set hardware flag
 hardware_present = detect_platform()
 
@@ -202,18 +266,22 @@ if hardware_present:
     try:
         from gpiozero.pins.pigpio import PiGPIOFactory
         from gpiozero import Servo, LED, Button
-        debug_print("GPIO libraries loaded successfully", "SUCCESS")
+        debug_print("GPIO libraries loaded successfully", level="SUCCESS")
     except ModuleNotFoundError:
-        debug_print("GPIO libraries not found. Running in simulation mode.", "WARNING")
+        debug_print("GPIO libraries not found. Running in simulation mode.", level="WARNING")
         hardware_present = False
 
 # Enable debug logging
-TESTING = True
+TESTING = __debug__
+
+def log(message, *args):
+    """Print debug messages when TESTING mode is enabled, args are %-formatted in here"""
+    if args:
+        message = message % args
+    print(f"  LOG: {message}")
 
-def log(message):
-    """Print debug messages when TESTING mode is enabled"""
-    if TESTING:
-        print(f"  LOG: {message}")
+if not TESTING:
+    log = no_op
 
 # ============================================================================
 # MONEY CLASS
@@ -221,33 +289,38 @@ def log(message):
 
 class Money(object):
     """Manages money tracking for the vending machine"""
+    __slots__ = ('amount', 'formatted')
     
     def __init__(self):
         self.amount = 0
-        debug_print("Money class initialized", "SUCCESS")
+        self.formatted = (0, "$0.00")  # last amount formatted and its text
+        debug_print("Money class initialized", level="SUCCESS")
     
     def add(self, value):
         self.amount += value
-        log(f"Added {value} cents. Total: {self.amount} cents")
+        log("Added %s cents. Total: %s cents", value, self.amount)
     
     def subtract(self, value):
         if value <= self.amount:
             self.amount -= value
-            log(f"Subtracted {value} cents. Remaining: {self.amount} cents")
+            log("Subtracted %s cents. Remaining: %s cents", value, self.amount)
             return True
         else:
-            log(f"Cannot subtract {value} cents. Only {self.amount} cents available")
+            log("Cannot subtract %s cents. Only %s cents available", value, self.amount)
             return False
     
     def get_amount(self):
         return self.amount
     
     def clear(self):
-        log(f"Clearing {self.amount} cents")
+        log("Clearing %s cents", self.amount)
         self.amount = 0
     
     def get_formatted(self):
-        return f"${self.amount / 100:.2f}"
+        # Only format again when the amount has changed
+        if self.formatted[0] != self.amount:
+            self.formatted = (self.amount, f"${self.amount / 100:.2f}")
+        return self.formatted[1]
 
 # ============================================================================
 # COINS CLASS
@@ -255,30 +328,46 @@ class Money(object):
 
 class Coins(object):
     """Manages coin denominations accepted by the vending machine"""
+    __slots__ = ('names', 'values', 'sorted_values')
     
     def __init__(self):
-        self.denominations = {}
-        debug_print("Coins class initialized", "SUCCESS")
+        # Names and values are kept in separate dicts so value lookups
+        # never go through a (name, value) tuple
+        self.names = {}
+        self.values = {}
+        self.sorted_values = ()  # coin values largest first, rebuilt when a coin is added
+        debug_print("Coins class initialized", level="SUCCESS")
     
     def add_coin(self, key, name, value):
-        self.denominations[key] = (name, value)
-        log(f"Added coin: {key} - {name} worth {value} cents")
+        self.names[key] = name
+        self.values[key] = value
+        self.sorted_values = tuple(sorted(self.values.values(), reverse=True))
+        log("Added coin: %s - %s worth %s cents", key, name, value)
     
     def get_coin(self, key):
-        return self.denominations.get(key)
+        if key in self.values:
+            return (self.names[key], self.values[key])
+        return None
+    
+    def get_value(self, key):
+        return self.values.get(key)
     
     def get_all_coins(self):
-        return self.denominations
+        return {key: (self.names[key], value) for key, value in self.values.items()}
     
     def coin_exists(self, key):
-        return key in self.denominations
+        return key in self.values
     
     def get_keys(self):
-        return self.denominations.keys()
+        return self.values.keys()
     
     def get_values(self):
-        values = [coin[1] for coin in self.denominations.values()]
-        return sorted(values, reverse=True)
+        return self.sorted_values
+    
+    def freeze(self):
+        """Make the coin tables read only once setup is done"""
+        self.names = MappingProxyType(self.names)
+        self.values = MappingProxyType(self.values)
 
 # ============================================================================
 # PRODUCTS CLASS
@@ -286,26 +375,88 @@ class Coins(object):
 
 class Products(object):
     """Manages products available in the vending machine"""
+    __slots__ = ('names', 'prices', 'labels')
     
     def __init__(self):
-        self.items = {}
-        debug_print("Products class initialized", "SUCCESS")
+        # Names and prices are kept in separate dicts like in Coins
+        self.names = {}
+        self.prices = {}
+        self.labels = {}  # button text, formatted once when the product is added
+        debug_print("Products class initialized", level="SUCCESS")
     
     def add_product(self, key, name, price):
-        self.items[key] = (name, price)
-        log(f"Added product: {key} - {name} at {price} cents")
+        self.names[key] = name
+        self.prices[key] = price
+        self.labels[key] = f"{key}\n${price/100:.2f}"
+        log("Added product: %s - %s at %s cents", key, name, price)
     
     def get_product(self, key):
-        return self.items.get(key)
+        if key in self.prices:
+            return (self.names[key], self.prices[key])
+        return None
+    
+    def get_name(self, key):
+        return self.names.get(key)
+    
+    def get_price(self, key):
+        return self.prices.get(key)
+    
+    def get_label(self, key):
+        return self.labels.get(key)
     
     def get_all_products(self):
-        return self.items
+        return {key: (self.names[key], price) for key, price in self.prices.items()}
     
     def product_exists(self, key):
-        return key in self.items
+        return key in self.prices
     
     def get_keys(self):
-        return self.items.keys()
+        return self.prices.keys()
+    
+    def freeze(self):
+        """Make the product tables read only once setup is done"""
+        self.names = MappingProxyType(self.names)
+        self.prices = MappingProxyType(self.prices)
+        self.labels = MappingProxyType(self.labels)
+
+# ============================================================================
+# SERVO WORKER
+# ============================================================================
+
+class ServoWorker(threading.Thread):
+    """Runs the servo dispense motion in its own thread so the GUI keeps responding"""
+    
+    def __init__(self, servo):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.servo = servo
+        self.requests = queue.Queue()  # one item per product to dispense, None stops the worker
+    
+    def dispense(self):
+        self.requests.put(True)
+    
+    def stop(self):
+        # Dispenses still waiting are dropped so only the one already moving finishes
+        try:
+            while True:
+                self.requests.get_nowait()
+        except queue.Empty:
+            pass
+        self.requests.put(None)
+    
+    def run(self):
+        while self.requests.get() is not None:
+            try:
+                self.servo.min()
+                sleep(0.5)
+                self.servo.mid()
+                sleep(0.5)
+                self.servo.max()
+                sleep(0.5)
+                self.servo.mid()
+                print("Product dispensed via servo motor")
+            except Exception as e:
+                print(f"Servo error: {e}")
 
 # ============================================================================
 # VENDING MACHINE CLASS
@@ -313,6 +464,12 @@ class Products(object):
 
 class VendingMachine(object):
     """Main vending machine controller implementing state machine pattern"""
+    __slots__ = ('state', 'states', 'event', 'money', 'products', 'coins',
+                 'change_due', 'change_plan', 'servo_worker', 'window',
+                 'amount_element', 'led_element', 'shown_amount', 'coin_values',
+                 'last_update_message_shown', 'blink_remaining', 'led_lit',
+                 'next_blink_at', 'event_kinds', 'return_messages',
+                 'shortfall_messages', 'dispense_messages')
 
     def __init__(self, window, products, coins):
         self.state = None
@@ -322,24 +479,55 @@ class VendingMachine(object):
         self.products = products
         self.coins = coins
         self.change_due = 0
+        self.change_plan = []  # (coin value, count) still to return, largest first
+        self.servo_worker = None  # set by main when a servo is connected
         self.window = window
+        # Look the display elements up once instead of on every update
+        self.amount_element = window['amount_display'] if window else None
+        self.led_element = window['-CHANGE_LED-'] if window else None
+        self.shown_amount = None  # amount the display shows, None until first drawn
         self.coin_values = self.coins.get_values()
         self.last_update_message_shown = False  # Track if update message was just shown
+        self.blink_remaining = 0  # LED on/off steps still to show
+        self.led_lit = False
+        self.next_blink_at = 0.0  # monotonic time the next blink step is due
+        
+        # What kind of input each event key is, so a state finds its handler
+        # with one lookup instead of testing coins, products and RETURN in turn
+        self.event_kinds = {}
+        for coin_key in self.coins.get_keys():
+            self.event_kinds[coin_key] = 'coin'
+        for product_key in self.products.get_keys():
+            self.event_kinds[product_key] = 'product'
+        self.event_kinds['RETURN'] = 'return'
+        
+        # Messages that only depend on the fixed coins and products are built
+        # once here, the parts that change are filled in with % when printed
+        self.return_messages = {value: "Returning %%d x %d cents" % value
+                                for value in self.coin_values}
+        self.shortfall_messages = {}
+        self.dispense_messages = {}
+        for product_key in self.products.get_keys():
+            self.shortfall_messages[product_key] = (
+                f"Insufficient funds. Need {self.products.get_price(product_key)} cents, "
+                "have %d cents")
+            self.dispense_messages[product_key] = (
+                f"Buzz... Whir... Click... {self.products.get_name(product_key)}")
         
-        debug_print(f"VendingMachine initialized with {len(self.coin_values)} coin types", "SUCCESS")
-        log(f"Coin values for change: {self.coin_values}")
+        debug_print("VendingMachine initialized with %s coin types", len(self.coin_values), level="SUCCESS")
+        log("Coin values for change: %s", self.coin_values)
 
     def add_state(self, state):
         self.states[state.name] = state
-        debug_print(f"Added state: {state.name}", "SUCCESS")
+        debug_print("Added state: %s", state.name, level="SUCCESS")
 
     def go_to_state(self, state_name):
         if self.state:
-            log(f'Exiting {self.state.name}')
+            log("Exiting %s", self.state.name)
             self.state.on_exit(self)
         
         self.state = self.states[state_name]
-        log(f'Entering {self.state.name}')
+        log("Entering %s", self.state.name)
         self.state.on_entry(self)
 
     def update(self):
@@ -348,18 +536,19 @@ class VendingMachine(object):
         self.update_display()
 
     def add_coin(self, coin_key):
-        coin_info = self.coins.get_coin(coin_key)
-        if coin_info:
-            coin_value = coin_info[1]
+        coin_value = self.coins.get_value(coin_key)
+        if coin_value:
             self.money.add(coin_value)
             self.last_update_message_shown = False  # Reset flag on significant events
 
     def update_display(self):
-        if self.window:
+        # The display only needs redrawing when the amount changes
+        if self.amount_element is not None and self.money.amount != self.shown_amount:
             try:
-                self.window['amount_display'].update(
+                self.amount_element.update(
                     f"Current Amount: {self.money.get_formatted()}"
                 )
+                self.shown_amount = self.money.amount
                 # Only show the success message if it wasn't shown last time
                 if not self.last_update_message_shown:
                     method_confirm("window[].update()", "SUCCESS", "Display updated")
@@ -368,58 +557,58 @@ class VendingMachine(object):
                 method_confirm("window[].update()", "FAILED", str(e))
                 self.last_update_message_shown = False
 
-    def button_action(self):
-        print("Physical RETURN button pressed")
-        self.event = 'RETURN'
-        self.update()
-    
     def dispense_product(self):
-        if hardware_present and servo:
+        if self.servo_worker:
             log("Activating servo motor to dispense product")
-            try:
-                servo.min()
-                sleep(0.5)
-                servo.mid()
-                sleep(0.5)
-                servo.max()
-                sleep(0.5)
-                servo.mid()
-                print("Product dispensed via servo motor")
-            except Exception as e:
-                print(f"Servo error: {e}")
+            self.servo_worker.dispense()
         else:
             log("Servo not available - simulating product dispense")
     
     def blink_change_led(self, blink_count=3):
-        CIRCLE = '⚫'  # ASCII for LED on
-        CIRCLE_OUTLINE = '⚪'  # ASCII for LED off
+        """Queue blinks of the change LED, the main loop shows them with blink_tick"""
+        log("Blinking change LED %s times", blink_count)
+        if not self.blink_remaining:
+            self.next_blink_at = monotonic() + BLINK_MS / 1000
+        self.blink_remaining += blink_count * 2
+    
+    def is_blinking(self):
+        return self.blink_remaining > 0
+    
+    def blink_wait_ms(self, idle_ms):
+        """How long the main loop can wait for events before a blink step or state tick is due"""
+        if not self.blink_remaining:
+            # A state waiting on ticks (returning change) moves on straight away
+            return 0 if self.state is not None and self.state.NEEDS_TICK else idle_ms
+        return max(0, int((self.next_blink_at - monotonic()) * 1000))
+    
+    def blink_tick(self):
+        """Show the next on or off step of a queued blink once it is due"""
+        if not self.blink_remaining:
+            return
+        now = monotonic()
+        if now < self.next_blink_at:
+            return
+        # Steps are scheduled from the last due time so they don't drift,
+        # after a long stall they start again from now instead of catching up
+        self.next_blink_at += BLINK_MS / 1000
+        if self.next_blink_at < now:
+            self.next_blink_at = now + BLINK_MS / 1000
+        self.blink_remaining -= 1
+        self.led_lit = not self.led_lit
         
         if hardware_present and led:
-            log(f"Blinking hardware LED {blink_count} times")
             try:
-                for i in range(blink_count):
+                if self.led_lit:
                     led.on()
-                    sleep(0.2)
+                else:
                     led.off()
-                    sleep(0.2)
-                print("Hardware LED blink complete")
             except Exception as e:
                 print(f"Hardware LED error: {e}")
-        else:
-            log("Hardware LED not available - using simulated LED")
         
         # GUI LED blinking
-        if self.window:
-            log(f"Blinking GUI LED {blink_count} times")
+        if self.led_element is not None:
             try:
-                for i in range(blink_count):
-                    self.window['-CHANGE_LED-'].update(CIRCLE)
-                    self.window.refresh()
-                    sleep(0.2)
-                    self.window['-CHANGE_LED-'].update(CIRCLE_OUTLINE)
-                    self.window.refresh()
-                    sleep(0.2)
-                method_confirm("LED blink", "SUCCESS", f"{blink_count} blinks")
+                self.led_element.update(CIRCLE if self.led_lit else CIRCLE_OUTLINE)
             except Exception as e:
                 method_confirm("LED blink", "FAILED", str(e))
 
@@ -430,9 +619,14 @@ class VendingMachine(object):
 class State(object):
     """Base class for all states"""
     _NAME = ""
+    HANDLERS = {}  # event kind -> method that handles it in this state
+    NEEDS_TICK = False  # True if update should also run on read() timeouts
+    __slots__ = ('handlers',)
     
     def __init__(self):
-        pass
+        # HANDLERS bound to this state once, so update calls them directly
+        self.handlers = {kind: MethodType(handler, self)
+                         for kind, handler in self.HANDLERS.items()}
     
     @property
     def name(self):
@@ -445,54 +639,61 @@ class State(object):
         pass
     
     def update(self, machine):
-        pass
+        handler = self.handlers.get(machine.event_kinds.get(machine.event))
+        if handler:
+            handler(machine)
 
 class WaitingState(State):
     """Initial state: waiting for first coin"""
     _NAME = "waiting"
+    __slots__ = ()
     
-    def update(self, machine):
-        if machine.coins.coin_exists(machine.event):
-            machine.add_coin(machine.event)
-            machine.go_to_state('add_coins')
-        elif machine.products.product_exists(machine.event):
-            print("Please insert coins first")
-        elif machine.event == "RETURN":
-            print("No money to return")
+    def insert_coin(self, machine):
+        machine.add_coin(machine.event)
+        machine.go_to_state('add_coins')
+    
+    def select_product(self, machine):
+        print("Please insert coins first")
+    
+    def press_return(self, machine):
+        print("No money to return")
+    
+    HANDLERS = {'coin': insert_coin, 'product': select_product, 'return': press_return}
 
 class AddCoinsState(State):
     """Active transaction state"""
     _NAME = "add_coins"
+    __slots__ = ()
     
-    def update(self, machine):
-        if machine.event == "RETURN":
-            machine.change_due = machine.money.get_amount()
-            machine.money.clear()
-            machine.go_to_state('count_change')
-        elif machine.coins.coin_exists(machine.event):
-            machine.add_coin(machine.event)
-        elif machine.products.product_exists(machine.event):
-            product = machine.products.get_product(machine.event)
-            product_price = product[1]
-            current_balance = machine.money.get_amount()
-            
-            if current_balance >= product_price:
-                machine.go_to_state('deliver_product')
-            else:
-                print(f"Insufficient funds. Need {product_price} cents, "
-                      f"have {current_balance} cents")
+    def press_return(self, machine):
+        machine.change_due = machine.money.get_amount()
+        machine.money.clear()
+        machine.go_to_state('count_change')
+    
+    def insert_coin(self, machine):
+        machine.add_coin(machine.event)
+    
+    def select_product(self, machine):
+        product_price = machine.products.get_price(machine.event)
+        current_balance = machine.money.get_amount()
+        
+        if current_balance >= product_price:
+            machine.go_to_state('deliver_product')
+        else:
+            print(machine.shortfall_messages[machine.event] % current_balance)
+    
+    HANDLERS = {'coin': insert_coin, 'product': select_product, 'return': press_return}
 
 class DeliverProductState(State):
     """Product delivery state"""
     _NAME = "deliver_product"
+    __slots__ = ()
     
     def on_entry(self, machine):
-        product = machine.products.get_product(machine.event)
-        product_name = product[0]
-        product_price = product[1]
+        product_price = machine.products.get_price(machine.event)
         
         machine.money.subtract(product_price)
-        print(f"Buzz... Whir... Click... {product_name}")
+        print(machine.dispense_messages[machine.event])
         machine.dispense_product()
         print(f"Remaining balance: {machine.money.get_formatted()}")
         
@@ -501,40 +702,37 @@ class DeliverProductState(State):
 class CountChangeState(State):
     """Change return state"""
     _NAME = "count_change"
+    NEEDS_TICK = True  # moves on to the next coin when the LED is done
+    __slots__ = ()
     
     def on_entry(self, machine):
         change_dollars = machine.change_due / 100
         print(f"Change due: ${change_dollars:.2f}")
-        log(f"Returning change: {machine.change_due} cents")
+        log("Returning change: %s cents", machine.change_due)
+        
+        # Work out how many of each coin to return up front
+        remaining = machine.change_due
+        machine.change_plan = []
+        for coin_value in machine.coin_values:
+            count, remaining = divmod(remaining, coin_value)
+            if count:
+                machine.change_plan.append((coin_value, count))
+        
         machine.blink_change_led(blink_count=3)
     
     def update(self, machine):
-        CIRCLE = '⚫'  # ASCII for LED on
-        CIRCLE_OUTLINE = '⚪'  # ASCII lowercase for LED off
+        # Each denomination is returned in one go with a blink per coin,
+        # the next waits until the LED is done
+        if machine.is_blinking():
+            return
         
-        for coin_value in machine.coin_values:
-            while machine.change_due >= coin_value:
-                print(f"Returning {coin_value} cents")
-                machine.change_due -= coin_value
-                
-                if hardware_present and led:
-                    led.on()
-                    sleep(0.15)
-                    led.off()
-                    sleep(0.15)
-                
-                if machine.window:
-                    try:
-                        machine.window['-CHANGE_LED-'].update(CIRCLE)
-                        machine.window.refresh()
-                        sleep(0.15)
-                        machine.window['-CHANGE_LED-'].update(CIRCLE_OUTLINE)
-                        machine.window.refresh()
-                        sleep(0.15)
-                    except Exception as e:
-                        log(f"GUI LED error: {e}")
+        if machine.change_plan:
+            coin_value, count = machine.change_plan.pop(0)
+            machine.change_due -= coin_value * count
+            print(machine.return_messages[coin_value] % count)
+            machine.blink_change_led(blink_count=count)
         
-        if machine.change_due == 0:
+        if not machine.change_plan:
             machine.go_to_state('waiting')
 
 # ============================================================================
@@ -550,7 +748,8 @@ def setup_coins():
     coins.add_coin("100", "$1", 100)
     coins.add_coin("200", "$2", 200)
     
-    debug_print(f"Coins setup complete - {len(coins.denominations)} types", "SUCCESS")
+    debug_print("Coins setup complete - %s types", len(coins.values), level="SUCCESS")
+    coins.freeze()
     return coins
 
 def setup_products():
@@ -567,9 +766,14 @@ def setup_products():
     products.add_product("crackers", "CRACKERS", 60)
     products.add_product("nuts", "NUTS", 150)
     
-    debug_print(f"Products setup complete - {len(products.items)} items", "SUCCESS")
+    debug_print("Products setup complete - %s items", len(products.prices), level="SUCCESS")
+    products.freeze()
     return products
 
+def led_indicator(color, key):
+    """Simulated LED using Text element"""
+    return sg.Text(CIRCLE_OUTLINE, text_color=color, key=key, font=FONT_DISPLAY)
+
 # ============================================================================
 # MAIN PROGRAM
 # ============================================================================
@@ -591,96 +795,39 @@ if __name__ == "__main__":
 
     debug_print("\n=== BUILDING GUI LAYOUT ===")
     
-    # Build GUI layout
-    coin_col = []
-    try:
-        coin_col.append([sg.Text("ENTER COINS", font=("Helvetica", 24))])
-        method_confirm("Create coin header", "SUCCESS")
-    except Exception as e:
-        method_confirm("Create coin header", "FAILED", str(e))
-    
-    # Create coin buttons
-    for coin_key in coins.get_keys():
-        try:
-            coin_info = coins.get_coin(coin_key)
-            button = sg.Button(coin_key, font=("Helvetica", 18))
-            coin_col.append([button])
-            method_confirm(f"Create coin button {coin_key}", "SUCCESS")
-        except Exception as e:
-            method_confirm(f"Create coin button {coin_key}", "FAILED", str(e))
-
-    # Product column
-    select_col = []
-    try:
-        select_col.append([sg.Text("SELECT ITEM", font=("Helvetica", 24))])
-        method_confirm("Create product header", "SUCCESS")
-    except Exception as e:
-        method_confirm("Create product header", "FAILED", str(e))
-    
-    # Create product buttons
-    product_buttons = []
-    for product_key in products.get_keys():
-        try:
-            product_info = products.get_product(product_key)
-            product_name = product_info[0]
-            product_price = product_info[1]
-            
-            button_text = f"{product_key}\n${product_price/100:.2f}"
-            button = sg.Button(button_text, key=product_key, 
-                              font=("Helvetica", 14), size=(12, 3))
-            product_buttons.append([button])
-            method_confirm(f"Create product button {product_key}", "SUCCESS")
-        except Exception as e:
-            method_confirm(f"Create product button {product_key}", "FAILED", str(e))
-    
-    # Scrollable product column
+    # Build GUI layout, one try covers the whole build and a failure stops startup
     try:
-        select_col.append([
-            sg.Column(product_buttons, scrollable=True, 
-                     vertical_scroll_only=True, size=(200, 300))
-        ])
-        method_confirm("Create scrollable column", "SUCCESS")
-    except Exception as e:
-        method_confirm("Create scrollable column", "FAILED", str(e))
+        # Coin column, the button text is the coin key so nothing else is looked up
+        coin_col = [[sg.Text("ENTER COINS", font=FONT_HEADER)]]
+        coin_col.extend([sg.Button(coin_key, font=FONT_COIN)]
+                        for coin_key in coins.get_keys())
+
+        # Product buttons from the precomputed labels, in a scrollable column
+        product_buttons = [[sg.Button(label, key=product_key,
+                                      font=FONT_PRODUCT, size=(12, 3))]
+                           for product_key, label in products.labels.items()]
+        select_col = [
+            [sg.Text("SELECT ITEM", font=FONT_HEADER)],
+            [sg.Column(product_buttons, scrollable=True, 
+                       vertical_scroll_only=True, size=(200, 300))]
+        ]
 
-    # Main layout
-    try:
+        # Main layout with the amount display and the return button with LED
         layout = [
             [sg.Column(coin_col, vertical_alignment="TOP"),
              sg.VSeparator(),
-             sg.Column(select_col, vertical_alignment="TOP")]
+             sg.Column(select_col, vertical_alignment="TOP")],
+            [sg.Text("Current Amount: $0.00", key='amount_display', 
+                     font=FONT_DISPLAY, size=(30, 1))],
+            [sg.Button("RETURN", font=FONT_SMALL),
+             sg.Text("  Change LED: ", font=FONT_SMALL),
+             led_indicator('red', '-CHANGE_LED-')]
         ]
-        method_confirm("Create main layout", "SUCCESS")
+        method_confirm("Build layout", "SUCCESS",
+                       f"{len(coin_col) - 1} coin and {len(product_buttons)} product buttons")
     except Exception as e:
-        method_confirm("Create main layout", "FAILED", str(e))
-    
-    # Add display
-    try:
-        layout.append([
-            sg.Text("Current Amount: $0.00", key='amount_display', 
-                   font=("Helvetica", 16), size=(30, 1))
-        ])
-        method_confirm("Add amount display", "SUCCESS")
-    except Exception as e:
-        method_confirm("Add amount display", "FAILED", str(e))
-    
-    # Add return button with LED
-    CIRCLE = '⚫'  # ASCII for LED on  
-    CIRCLE_OUTLINE = '⚪'  # ASCII for LED off
-    
-    def LED(color, key):
-        """Simulated LED using Text element"""
-        return sg.Text(CIRCLE_OUTLINE, text_color=color, key=key, font=("Helvetica", 16))
-    
-    try:
-        layout.append([
-            sg.Button("RETURN", font=("Helvetica", 12)),
-            sg.Text("  Change LED: ", font=("Helvetica", 12)),
-            LED('red', '-CHANGE_LED-')
-        ])
-        method_confirm("Add RETURN button with LED", "SUCCESS")
-    except Exception as e:
-        method_confirm("Add RETURN button with LED", "FAILED", str(e))
+        method_confirm("Build layout", "FAILED", str(e))
+        sys.exit(1)
     
     # Create window
     debug_print("\n=== CREATING WINDOW ===")
@@ -696,19 +843,12 @@ if __name__ == "__main__":
     vending = VendingMachine(window, products, coins)
 
     # Register states
-    vending.add_state(WaitingState())
-    vending.add_state(AddCoinsState())
-    vending.add_state(DeliverProductState())
-    vending.add_state(CountChangeState())
+    for state_class in (WaitingState, AddCoinsState, DeliverProductState, CountChangeState):
+        vending.add_state(state_class())
 
     # Set initial state
     vending.go_to_state('waiting')
 
-    # Initialize GPIO if on Pi
-    if hardware_present:
-        debug_print("\n=== INITIALIZING GPIO ===")
-        
-
     # Initialize GPIO if on Pi
     if hardware_present:
         debug_print("\n=== INITIALIZING GPIO ===")
@@ -716,63 +856,57 @@ if __name__ == "__main__":
         # If PiGPIOFactory is available, ensure pigpiod daemon is running so we can use hardware PWM.
         try:
             if 'PiGPIOFactory' in globals() or 'PiGPIOFactory' in locals():
-                debug_print("Attempting to start pigpiod daemon (if not already running)...", "INFO")
-                # start pigpiod if available; ignore failures to avoid crashing
-                try:
-                    os.system("sudo pigpiod >/dev/null 2>&1 || true")
-                    sleep(0.5)
-                    debug_print("pigpiod start command issued", "SUCCESS")
-                except Exception as e:
-                    debug_print(f"Failed to start pigpiod: {e}", "WARNING")
+                if pigpiod_running():
+                    debug_print("pigpiod daemon already running")
+                else:
+                    debug_print("Attempting to start pigpiod daemon...")
+                    # start pigpiod if available; ignore failures to avoid crashing
+                    try:
+                        subprocess.run(["sudo", "pigpiod"], check=False,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                        sleep(0.3)
+                        debug_print("pigpiod start command issued", level="SUCCESS")
+                    except Exception as e:
+                        debug_print("Failed to start pigpiod: %s", e, level="WARNING")
             else:
-                debug_print("PiGPIOFactory not imported; will attempt GPIO without pigpiod", "WARNING")
+                debug_print("PiGPIOFactory not imported; will attempt GPIO without pigpiod", level="WARNING")
         except Exception as e:
-            debug_print(f"pigpiod start step failed: {e}", "WARNING")
+            debug_print("pigpiod start step failed: %s", e, level="WARNING")
 
         # Initialize servo using PiGPIOFactory when possible (provides reliable hardware PWM)
         try:
             if 'PiGPIOFactory' in globals() or 'PiGPIOFactory' in locals():
                 factory = PiGPIOFactory()
                 servo = Servo(SERVO_PIN, pin_factory=factory)
-                debug_print("Using PiGPIOFactory for servo", "INFO")
+                debug_print("Using PiGPIOFactory for servo")
             else:
                 servo = Servo(SERVO_PIN)
             servo.mid()
-            debug_print(f"Servo initialized on GPIO {SERVO_PIN}", "SUCCESS")
+            debug_print("Servo initialized on GPIO %s", SERVO_PIN, level="SUCCESS")
         except Exception as e:
-            debug_print(f"Servo initialization failed: {e}", "ERROR")
+            debug_print("Servo initialization failed: %s", e, level="ERROR")
             servo = None
 
-        try:
-            led = LED(LED_PIN)
-            led.off()
-            debug_print(f"LED initialized on GPIO {LED_PIN}", "SUCCESS")
-        except Exception as e:
-            debug_print(f"LED initialization failed: {e}", "ERROR")
-            led = None
+        if servo:
+            vending.servo_worker = ServoWorker(servo)
+            vending.servo_worker.start()
 
-        try:
-            return_button = Button(BUTTON_PIN, pull_up=True)
-            return_button.when_pressed = vending.button_action
-            debug_print(f"Button initialized on GPIO {BUTTON_PIN}", "SUCCESS")
-        except Exception as e:
-            debug_print(f"Button initialization failed: {e}", "ERROR")
-            return_button = None
-        
         try:
             led = LED(LED_PIN)
             led.off()
-            debug_print(f"LED initialized on GPIO {LED_PIN}", "SUCCESS")
+            debug_print("LED initialized on GPIO %s", LED_PIN, level="SUCCESS")
         except Exception as e:
-            debug_print(f"LED initialization failed: {e}", "ERROR")
+            debug_print("LED initialization failed: %s", e, level="ERROR")
             led = None
-        
+
         try:
-            return_button = Button(BUTTON_PIN, pull_up=True)
-            return_button.when_pressed = vending.button_action
-            debug_print(f"Button initialized on GPIO {BUTTON_PIN}", "SUCCESS")
+            return_button = Button(BUTTON_PIN, pull_up=True, bounce_time=BOUNCE_S)
+            # Runs on the gpiozero thread, so the press is only handed to the GUI loop
+            # as an event, partial calls write_event_value without a Python wrapper
+            return_button.when_pressed = partial(window.write_event_value, '-HW_BUTTON-', None)
+            debug_print("Button initialized on GPIO %s", BUTTON_PIN, level="SUCCESS")
         except Exception as e:
-            debug_print(f"Button initialization failed: {e}", "ERROR")
+            debug_print("Button initialization failed: %s", e, level="ERROR")
             return_button = None
     
     debug_print("\n=== VENDING MACHINE READY ===")
@@ -781,16 +915,27 @@ if __name__ == "__main__":
     # Main event loop
     event_count = 0
     while True:
-        event, values = window.read(timeout=10)
+        # While the change LED is blinking read() only waits until the next step is due,
+        # the machine is driven by the event alone so the values dict is not kept
+        event, _ = window.read(timeout=vending.blink_wait_ms(POLL_MS))
+        vending.blink_tick()
         
-        if event != '__TIMEOUT__':
+        if event != sg.TIMEOUT_EVENT:
             event_count += 1
-            log(f"Event #{event_count}: {event}")
+            log("Event #%s: %s", event_count, event)
         
         if event in (sg.WIN_CLOSED, 'Exit'):
-            debug_print("Window closed by user", "INFO")
+            debug_print("Window closed by user")
             break
         
+        if event == '-HW_BUTTON-':
+            print("Physical RETURN button pressed")
+            event = 'RETURN'
+        
+        # A timeout has nothing for the states to handle unless the current
+        # state asked for ticks, a closed window never gets this far
+        if event == sg.TIMEOUT_EVENT and not vending.state.NEEDS_TICK:
+            continue
         vending.event = event
         vending.update()
 
@@ -798,30 +943,25 @@ if __name__ == "__main__":
     debug_print("\n=== CLEANUP ===")
     
     if hardware_present:
-        try:
-            if servo:
+        # A device that fails to shut down must not stop the others from closing
+        if vending.servo_worker:
+            with suppress(Exception):
+                # Let a dispense that is already moving finish first
+                vending.servo_worker.stop()
+                vending.servo_worker.join(timeout=3)
+        if servo:
+            with suppress(Exception):
                 servo.mid()
-                servo.close()
-                debug_print("Servo cleaned up", "SUCCESS")
-        except:
-            pass
-        
-        try:
-            if led:
+        if led:
+            with suppress(Exception):
                 led.off()
-                led.close()
-                debug_print("LED cleaned up", "SUCCESS")
-        except:
-            pass
-        
-        try:
-            if return_button:
-                return_button.close()
-                debug_print("Button cleaned up", "SUCCESS")
-        except:
-            pass
+        for device, device_name in ((servo, "Servo"), (led, "LED"), (return_button, "Button")):
+            if device:
+                with suppress(Exception):
+                    device.close()
+                    debug_print("%s cleaned up", device_name, level="SUCCESS")
     
     window.close()
-    debug_print("Window closed", "SUCCESS")
+    debug_print("Window closed", level="SUCCESS")
     debug_print("=== VENDING MACHINE SHUTDOWN COMPLETE ===")
     print("Normal exit")